@@ -52,6 +52,23 @@ impl TransformClient {
         Ok(())
     }
 
+    /// Send a pure translation to the server
+    ///
+    /// The rotation is the identity.
+    /// Time is in nanoseconds since Unix epoch
+    pub async fn send_translation(
+        &self,
+        from: &str,
+        to: &str,
+        translation: [f64; 3],
+        stamp: i64,
+        kind: TransformType,
+    ) -> Result<(), CommsError> {
+        let stamped_isometry =
+            schiebung::types::StampedIsometry::new(translation, [0.0, 0.0, 0.0, 1.0], stamp);
+        self.send_transform(from, to, stamped_isometry, kind).await
+    }
+
     /// Request a transform from the server
     /// Time is in nanoseconds since Unix epoch
     pub async fn request_transform(
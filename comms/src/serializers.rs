@@ -4,6 +4,18 @@ use schiebung::types::StampedIsometry;
 
 const TRANSLATION_SIZE: u32 = 3;
 const ROTATION_SIZE: u32 = 4;
+const IDENTITY_ROTATION: [f64; 4] = [0.0, 0.0, 0.0, 1.0];
+
+/// Read a rotation list; an unset or empty list is the identity.
+///
+/// The serializers always write all four components, because older readers
+/// index the list directly and cannot handle an empty one.
+fn read_rotation(rot: capnp::primitive_list::Reader<'_, f64>) -> [f64; 4] {
+    if rot.len() == 0 {
+        return IDENTITY_ROTATION;
+    }
+    [rot.get(0), rot.get(1), rot.get(2), rot.get(3)]
+}
 
 /// Serialize a new transform with StampedIsometry
 pub fn serialize_new_transform(
@@ -63,10 +75,7 @@ pub fn deserialize_new_transform(
         [trans.get(0), trans.get(1), trans.get(2)]
     };
 
-    let rotation = {
-        let rot = transform.get_rotation()?;
-        [rot.get(0), rot.get(1), rot.get(2), rot.get(3)]
-    };
+    let rotation = read_rotation(transform.get_rotation()?);
 
     let stamped_isometry = StampedIsometry::new(translation, rotation, transform.get_time_ns());
     let kind = transform.get_kind()?;
@@ -158,10 +167,7 @@ pub fn deserialize_transform_response(
             [trans.get(0), trans.get(1), trans.get(2)]
         };
 
-        let rotation = {
-            let rot = response.get_rotation()?;
-            [rot.get(0), rot.get(1), rot.get(2), rot.get(3)]
-        };
+        let rotation = read_rotation(response.get_rotation()?);
 
         let stamped_isometry = StampedIsometry::new(translation, rotation, response.get_time_ns());
         Ok(Ok(stamped_isometry))
@@ -196,6 +202,49 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_new_transform_identity_rotation_stays_on_the_wire() {
+        let identity = StampedIsometry::new([1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 1.0], 7);
+        let rotated = StampedIsometry::new([1.0, 2.0, 3.0], [0.0, 0.0, 0.6, 0.8], 7);
+
+        let kind = messages_capnp::TransformKind::Dynamic;
+        let identity_bytes = serialize_new_transform("a", "b", &identity, kind).unwrap();
+        let rotated_bytes = serialize_new_transform("a", "b", &rotated, kind).unwrap();
+        // Older readers index the rotation list, so it must always be complete.
+        assert_eq!(identity_bytes.len(), rotated_bytes.len());
+
+        let (from, to, result, _) = deserialize_new_transform(&identity_bytes).unwrap();
+        assert_eq!((from.as_str(), to.as_str()), ("a", "b"));
+        assert_eq!(result.translation(), [1.0, 2.0, 3.0]);
+        assert_eq!(result.rotation(), [0.0, 0.0, 0.0, 1.0]);
+        assert_eq!(result.stamp(), 7);
+
+        let (_, _, result, _) = deserialize_new_transform(&rotated_bytes).unwrap();
+        let rot = result.rotation();
+        assert!((rot[2] - 0.6).abs() < 1e-12 && (rot[3] - 0.8).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_new_transform_without_rotation_reads_as_identity() {
+        let mut message = capnp::message::Builder::new_default();
+        {
+            let mut transform = message.init_root::<new_transform::Builder>();
+            transform.set_from("a");
+            transform.set_to("b");
+            transform.set_time_ns(7);
+            let mut trans = transform.reborrow().init_translation(TRANSLATION_SIZE);
+            for i in 0..TRANSLATION_SIZE {
+                trans.set(i, 1.0);
+            }
+            transform.set_kind(messages_capnp::TransformKind::Static);
+        }
+        let mut bytes = Vec::new();
+        capnp::serialize::write_message(&mut bytes, &message).unwrap();
+
+        let (_, _, result, _) = deserialize_new_transform(&bytes).unwrap();
+        assert_eq!(result.rotation(), [0.0, 0.0, 0.0, 1.0]);
+    }
+
     #[test]
     fn test_transform_response_error() {
         // Test error response
@@ -2,12 +2,110 @@ use crate::config::{ZenohConfig, TRANSFORM_PUB_TOPIC};
 use crate::error::CommsError;
 use log::{debug, error, info, warn};
 use schiebung::{types::StampedIsometry, BufferTree, TransformUpdate};
-use std::sync::{Arc, RwLock};
+use std::sync::{Arc, Condvar, Mutex, RwLock};
+use std::time::{Duration, Instant};
+
+/// Wakes threads that are waiting for new transforms to reach a
+/// [`TransformServer`]'s buffer.
+///
+/// Holds a generation counter that is bumped once per stored transform.
+/// Waiters remember the generation they last saw and park on a condition
+/// variable until it moves, so an idle consumer costs no wakeups at all.
+#[derive(Debug, Default)]
+pub struct UpdateNotifier {
+    generation: Mutex<u64>,
+    condvar: Condvar,
+}
+
+impl UpdateNotifier {
+    /// Current generation.
+    pub fn generation(&self) -> u64 {
+        *self.generation.lock().unwrap_or_else(|p| p.into_inner())
+    }
+
+    /// Bump the generation and wake every waiter.
+    pub fn notify(&self) {
+        let mut generation = self.generation.lock().unwrap_or_else(|p| p.into_inner());
+        *generation = generation.wrapping_add(1);
+        self.condvar.notify_all();
+    }
+
+    /// Block until the generation differs from `seen` or `timeout` elapses.
+    ///
+    /// Returns the new generation, or `None` on timeout.
+    pub fn wait_past(&self, seen: u64, timeout: Duration) -> Option<u64> {
+        let guard = self.generation.lock().unwrap_or_else(|p| p.into_inner());
+        let (guard, _) = self
+            .condvar
+            .wait_timeout_while(guard, timeout, |generation| *generation == seen)
+            .unwrap_or_else(|p| p.into_inner());
+        (*guard != seen).then_some(*guard)
+    }
+
+    /// Block until the latest `from -> to` transform in `buffer` is newer than
+    /// the one available when the call started, or `timeout` elapses.
+    ///
+    /// "Newer" compares the stamp returned by
+    /// [`BufferTree::lookup_latest_transform`], i.e. the newest sample along
+    /// the path. If the frames are not connected yet, the first successful
+    /// lookup counts as an update. Returns `None` on timeout.
+    pub fn wait_for_transform(
+        &self,
+        buffer: &RwLock<BufferTree>,
+        from: &str,
+        to: &str,
+        timeout: Duration,
+    ) -> Option<StampedIsometry> {
+        self.wait_for_newer(timeout, || {
+            buffer
+                .read()
+                .unwrap_or_else(|p| p.into_inner())
+                .lookup_latest_transform(from, to)
+                .ok()
+        })
+    }
+
+    /// Block until `probe` returns a transform stamped later than the one it
+    /// returned on its first call, or `timeout` elapses.
+    ///
+    /// `probe` is re-run once per generation bump, so it should be a cheap
+    /// lookup; [`wait_for_transform`](Self::wait_for_transform) is this with a
+    /// by-name lookup. Returns `None` on timeout.
+    pub fn wait_for_newer<F>(&self, timeout: Duration, mut probe: F) -> Option<StampedIsometry>
+    where
+        F: FnMut() -> Option<StampedIsometry>,
+    {
+        let deadline = Instant::now() + timeout;
+        let mut baseline: Option<Option<i64>> = None;
+        loop {
+            // Read the generation before probing, so an update landing in
+            // between is not missed by the wait below.
+            let seen = self.generation();
+            let latest = probe();
+            let stamp = latest.as_ref().map(|t| t.stamp());
+            match baseline {
+                None => baseline = Some(stamp),
+                Some(previous) => {
+                    if stamp.is_some() && stamp > previous {
+                        return latest;
+                    }
+                }
+            }
+
+            let remaining = deadline.saturating_duration_since(Instant::now());
+            if remaining.is_zero() {
+                return None;
+            }
+            self.wait_past(seen, remaining);
+        }
+    }
+}
 
 /// Server regarding Schiebung transforms
 #[derive(Clone)]
 pub struct TransformServer {
     buffer: Arc<RwLock<BufferTree>>,
+    notifier: Arc<UpdateNotifier>,
     session: zenoh::Session,
 }
 
@@ -31,7 +129,11 @@ impl TransformServer {
             .map_err(|e| CommsError::Zenoh(format!("Failed to open zenoh session: {}", e)))?;
         info!("Zenoh session established in {} mode", config.mode);
 
-        Ok(Self { buffer, session })
+        Ok(Self {
+            buffer,
+            notifier: Arc::new(UpdateNotifier::default()),
+            session,
+        })
     }
 
     /// Get a reference to the underlying buffer tree
@@ -39,6 +141,11 @@ impl TransformServer {
         self.buffer.clone()
     }
 
+    /// Get the notifier that fires whenever a received transform is stored
+    pub fn notifier(&self) -> Arc<UpdateNotifier> {
+        self.notifier.clone()
+    }
+
     /// Run the transform server
     ///
     /// The server processes incoming transforms in an unbounded loop. While this means
@@ -172,21 +279,25 @@ impl TransformServer {
 
         let transform_type = kind.into();
 
-        // Handle rwlock poisoning by recovering the data
-        let mut buf = match self.buffer.write() {
-            Ok(guard) => guard,
-            Err(poisoned) => {
-                warn!("Buffer rwlock was poisoned, recovering...");
-                poisoned.into_inner()
-            }
-        };
+        {
+            // Handle rwlock poisoning by recovering the data
+            let mut buf = match self.buffer.write() {
+                Ok(guard) => guard,
+                Err(poisoned) => {
+                    warn!("Buffer rwlock was poisoned, recovering...");
+                    poisoned.into_inner()
+                }
+            };
 
-        buf.update(&[TransformUpdate::new(
-            from.clone(),
-            to.clone(),
-            stamped_isometry,
-            transform_type,
-        )])?;
+            buf.update(&[TransformUpdate::new(
+                from.clone(),
+                to.clone(),
+                stamped_isometry,
+                transform_type,
+            )])?;
+        }
+        // Wake waiters only after the write lock is released.
+        self.notifier.notify();
         info!(
             "Stored transform: {} -> {} ({:?})",
             from, to, transform_type
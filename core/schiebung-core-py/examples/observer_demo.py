@@ -4,15 +4,23 @@ Example demonstrating Python observer callbacks with schiebung BufferTree.
 
 This shows how to register Python functions as observers to receive
 transform updates without needing separate packages like schiebung-rerun-py.
+
+If numba is installed, it also registers a `numba.cfunc` as a native
+observer that is called straight from Rust, without building Python objects.
 """
 
 from schiebung import BufferTree, StampedIsometry, TransformType
 import time
 
+try:
+    from numba import carray, cfunc
+except ImportError:  # numba is optional, skip the native observer
+    cfunc = None
+
 
 def simple_observer(from_frame, to_frame, transform, kind):
     """A simple observer that prints transform updates."""
-    trans = transform.translation()
+    trans = transform.as_translation()
     print(f"Transform update: {from_frame} -> {to_frame}")
     print(f"  Translation: [{trans[0]:.2f}, {trans[1]:.2f}, {trans[2]:.2f}]")
     print(f"  Type: {kind}")
@@ -31,6 +39,19 @@ class TransformLogger:
         print(f"[{self.name}] Logged transform #{self.count}: {from_frame} -> {to_frame}")
 
 
+if cfunc is not None:
+
+    @cfunc("void(CPointer(int8), CPointer(int8), CPointer(float64), int64, uint8)")
+    def native_observer(from_frame, to_frame, data, stamp_ns, kind):
+        """A compiled observer, called from Rust after the Python observers.
+
+        `data` points at [x, y, z, qx, qy, qz, qw].
+        """
+        xyz_qxyzw = carray(data, 7)
+        print("  [native] translation:", xyz_qxyzw[0], xyz_qxyzw[1], xyz_qxyzw[2],
+              "stamp_ns:", stamp_ns)
+
+
 def main():
     print("=" * 60)
     print("Python Observer Demo")
@@ -51,6 +72,11 @@ def main():
     buf.register_observer(logger)
     print()
 
+    if cfunc is not None:
+        print("2b. Registering numba cfunc observer...")
+        buf.register_observer_cfunc(native_observer.address)
+        print()
+
     # Add some transforms - observers will be called for each
     print("3. Adding transforms (observers will be notified)...")
     print("-" * 60)
@@ -1,9 +1,15 @@
-use numpy::ndarray::Array2;
-use numpy::{IntoPyArray, PyArray1, PyArray2, PyReadonlyArray2, PyUntypedArrayMethods};
+use numpy::ndarray::{Array2, ArrayD, Dimension, IxDyn};
+use numpy::{
+    Element, IntoPyArray, PyArray1, PyArray2, PyArrayDyn, PyReadonlyArray, PyReadonlyArray1,
+    PyReadonlyArray2, PyReadonlyArrayDyn, PyUntypedArrayMethods,
+};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyFloat, PyType};
 use pyo3::PyTypeInfo;
+use std::borrow::Cow;
+use std::ffi::{c_char, CString};
+use std::sync::{Arc, Mutex, OnceLock};
 
 /// Resolve a Python `stamp` argument to nanoseconds.
 ///
@@ -45,6 +51,25 @@ fn homogeneous_matrix(iso: &CoreStampedIsometry) -> Array2<f64> {
     out
 }
 
+/// Elements of `array` in row-major order, borrowed in place when the array
+/// is C-contiguous and copied once otherwise.
+///
+/// `as_slice` alone is not enough: it also accepts Fortran-ordered arrays and
+/// returns them in memory (column-major) order.
+fn contiguous_data<'a, T, D>(array: &'a PyReadonlyArray<'_, T, D>) -> Cow<'a, [T]>
+where
+    T: Element + Copy,
+    D: Dimension,
+{
+    if array.is_c_contiguous() {
+        if let Ok(slice) = array.as_slice() {
+            return Cow::Borrowed(slice);
+        }
+    }
+    Cow::Owned(array.as_array().iter().copied().collect())
+}
+
+use ::schiebung::interpolation::lerp_slerp;
 use ::schiebung::{
     BufferObserver as CoreBufferObserver, BufferTree as CoreBufferTree,
     FormatLoader as CoreFormatLoader, StampedIsometry as CoreStampedIsometry,
@@ -174,16 +199,40 @@ impl TransformType {
 pub struct StampedIsometry {
     /// The underlying core stamped isometry (public for inter-crate access)
     pub inner: CoreStampedIsometry,
+    /// Memoized `euler_angles()`; reset whenever the rotation is overwritten.
+    euler: OnceLock<[f64; 3]>,
+    /// Set on instances handed to observers, which share one object per update.
+    read_only: bool,
 }
 
 impl From<CoreStampedIsometry> for StampedIsometry {
     fn from(stamped_isometry: CoreStampedIsometry) -> Self {
         StampedIsometry {
             inner: stamped_isometry,
+            euler: OnceLock::new(),
+            read_only: false,
         }
     }
 }
 
+impl StampedIsometry {
+    /// Roll, pitch, yaw of the rotation, computed once per rotation.
+    fn cached_euler_angles(&self) -> [f64; 3] {
+        *self.euler.get_or_init(|| self.inner.euler_angles())
+    }
+
+    /// Reject the in-place setters on instances delivered to observers.
+    fn check_writable(&self) -> PyResult<()> {
+        if self.read_only {
+            return Err(PyValueError::new_err(
+                "StampedIsometry passed to an observer is shared with the other \
+                 observers and read-only; use copy.copy() to get a mutable copy",
+            ));
+        }
+        Ok(())
+    }
+}
+
 #[pymethods]
 impl StampedIsometry {
     /// Create a new `StampedIsometry`.
@@ -205,9 +254,11 @@ impl StampedIsometry {
     #[new]
     fn new(translation: [f64; 3], rotation: [f64; 4], stamp: Bound<'_, PyAny>) -> PyResult<Self> {
         let stamp_ns = stamp_to_ns(&stamp)?;
-        Ok(StampedIsometry {
-            inner: CoreStampedIsometry::new(translation, rotation, stamp_ns),
-        })
+        Ok(StampedIsometry::from(CoreStampedIsometry::new(
+            translation,
+            rotation,
+            stamp_ns,
+        )))
     }
 
     /// Create a new StampedIsometry with timestamp in seconds (float)
@@ -219,9 +270,11 @@ impl StampedIsometry {
     /// * `stamp_secs` - Timestamp in seconds since Unix epoch (float)
     #[staticmethod]
     fn from_secs(translation: [f64; 3], rotation: [f64; 4], stamp_secs: f64) -> Self {
-        StampedIsometry {
-            inner: CoreStampedIsometry::from_secs(translation, rotation, stamp_secs),
-        }
+        StampedIsometry::from(CoreStampedIsometry::from_secs(
+            translation,
+            rotation,
+            stamp_secs,
+        ))
     }
 
     /// Get the translation as [x, y, z]
@@ -244,13 +297,27 @@ impl StampedIsometry {
     }
 
     /// Get the translation as a numpy array of shape (3,).
+    ///
+    /// The array is a fresh copy (a single memcpy straight from the stored
+    /// vector, no intermediate list), so it stays valid and unchanged if the
+    /// isometry is later mutated with the `set_*` methods. Prefer this over
+    /// `translation()` when the result is handed to numpy or rerun anyway.
     fn as_translation<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
-        self.inner.translation().to_vec().into_pyarray(py)
+        PyArray1::from_slice(py, self.inner.isometry.translation.vector.as_slice())
     }
 
     /// Get the rotation quaternion as a numpy array of shape (4,) in xyzw order.
+    ///
+    /// Copied straight from nalgebra's xyzw coordinate storage, like `as_translation`.
     fn as_quaternion<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
-        self.inner.rotation().to_vec().into_pyarray(py)
+        PyArray1::from_slice(py, self.inner.isometry.rotation.coords.as_slice())
+    }
+
+    /// Get Euler angles (roll, pitch, yaw) in radians as a numpy array of shape (3,).
+    ///
+    /// Same values as `euler_angles()`, without boxing each angle in a list.
+    fn as_euler_angles<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.cached_euler_angles())
     }
 
     /// NumPy interop hook: makes `np.asarray(stamped_iso)` return the 4×4
@@ -327,9 +394,145 @@ impl StampedIsometry {
         ));
         let q = nalgebra::UnitQuaternion::from_rotation_matrix(&rot);
         let rotation = [q.i, q.j, q.k, q.w];
-        Ok(StampedIsometry {
-            inner: CoreStampedIsometry::new(translation, rotation, stamp_ns),
-        })
+        Ok(StampedIsometry::from(CoreStampedIsometry::new(
+            translation,
+            rotation,
+            stamp_ns,
+        )))
+    }
+
+    /// Build a `StampedIsometry` from a pair of float64 numpy buffers.
+    ///
+    /// `translation` must have shape `(3,)` and `rotation` shape `(4,)` in
+    /// xyzw order. Both are read in place, so a hot loop can keep one pair of
+    /// preallocated arrays and overwrite their entries each tick instead of
+    /// building fresh Python lists. The values are copied out; mutating the
+    /// buffers afterwards does not affect the returned isometry.
+    ///
+    /// The `stamp` argument follows the same int-or-float convention as
+    /// the constructor: `int` is nanoseconds, `float` is seconds.
+    #[classmethod]
+    fn from_buffers(
+        _cls: &Bound<'_, PyType>,
+        translation: PyReadonlyArray1<'_, f64>,
+        rotation: PyReadonlyArray1<'_, f64>,
+        stamp: Bound<'_, PyAny>,
+    ) -> PyResult<Self> {
+        let stamp_ns = stamp_to_ns(&stamp)?;
+        if translation.shape() != [3] {
+            return Err(PyValueError::new_err(format!(
+                "translation must have shape (3,), got {:?}",
+                translation.shape()
+            )));
+        }
+        if rotation.shape() != [4] {
+            return Err(PyValueError::new_err(format!(
+                "rotation must have shape (4,), got {:?}",
+                rotation.shape()
+            )));
+        }
+        let t = translation.as_array();
+        let r = rotation.as_array();
+        Ok(StampedIsometry::from(CoreStampedIsometry::new(
+            [t[0], t[1], t[2]],
+            [r[0], r[1], r[2], r[3]],
+            stamp_ns,
+        )))
+    }
+
+    /// Build one `StampedIsometry` per row of three parallel numpy arrays.
+    ///
+    /// `translations` is float64 `(N, 3)`, `rotations` float64 `(N, 4)` in
+    /// xyzw order and `stamps` int64 `(N,)` in nanoseconds. All three are read
+    /// in place, so constructing many transforms costs one call instead of N
+    /// constructor calls with freshly built lists.
+    ///
+    /// Returns:
+    ///     list[StampedIsometry] of length N
+    #[classmethod]
+    fn from_arrays(
+        _cls: &Bound<'_, PyType>,
+        translations: PyReadonlyArray2<'_, f64>,
+        rotations: PyReadonlyArray2<'_, f64>,
+        stamps: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<Vec<Self>> {
+        let n = stamps.len();
+        if translations.shape() != [n, 3] {
+            return Err(PyValueError::new_err(format!(
+                "translations must have shape ({}, 3), got {:?}",
+                n,
+                translations.shape()
+            )));
+        }
+        if rotations.shape() != [n, 4] {
+            return Err(PyValueError::new_err(format!(
+                "rotations must have shape ({}, 4), got {:?}",
+                n,
+                rotations.shape()
+            )));
+        }
+        let t = translations.as_array();
+        let r = rotations.as_array();
+        let stamps = stamps.as_array();
+        Ok((0..n)
+            .map(|i| {
+                StampedIsometry::from(CoreStampedIsometry::new(
+                    [t[[i, 0]], t[[i, 1]], t[[i, 2]]],
+                    [r[[i, 0]], r[[i, 1]], r[[i, 2]], r[[i, 3]]],
+                    stamps[i],
+                ))
+            })
+            .collect())
+    }
+
+    /// Identity transform at stamp 0.
+    ///
+    /// Handy as a reusable prototype in hot loops: create it once, then
+    /// overwrite it with `set_translation` / `set_rotation_xyzw` /
+    /// `set_stamp_ns` each tick. The buffer and clients copy the value on
+    /// insert, so mutating it afterwards is safe.
+    #[staticmethod]
+    fn identity() -> Self {
+        StampedIsometry::from(CoreStampedIsometry::new(
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+            0,
+        ))
+    }
+
+    /// Overwrite the translation in place.
+    ///
+    /// The `set_*` methods raise on instances received by an observer, since
+    /// those are shared between all observers of the same update.
+    fn set_translation(&mut self, x: f64, y: f64, z: f64) -> PyResult<()> {
+        self.check_writable()?;
+        self.inner.isometry.translation = nalgebra::Translation3::new(x, y, z);
+        Ok(())
+    }
+
+    /// Overwrite the rotation in place from an [x, y, z, w] quaternion (normalized).
+    fn set_rotation_xyzw(&mut self, x: f64, y: f64, z: f64, w: f64) -> PyResult<()> {
+        self.check_writable()?;
+        self.inner.isometry.rotation =
+            nalgebra::UnitQuaternion::from_quaternion(nalgebra::Quaternion::new(w, x, y, z));
+        self.euler = OnceLock::new();
+        Ok(())
+    }
+
+    /// Overwrite the timestamp in place, in nanoseconds since Unix epoch.
+    fn set_stamp_ns(&mut self, stamp_ns: i64) -> PyResult<()> {
+        self.check_writable()?;
+        self.inner.stamp = stamp_ns;
+        Ok(())
+    }
+
+    /// Mutable copy, also for instances received by an observer.
+    fn __copy__(&self) -> Self {
+        StampedIsometry::from(self.inner.clone())
+    }
+
+    fn __deepcopy__(&self, _memo: Bound<'_, PyAny>) -> Self {
+        self.__copy__()
     }
 
     /// Get the timestamp in nanoseconds since Unix epoch
@@ -358,8 +561,10 @@ impl StampedIsometry {
     }
 
     /// Get Euler angles (roll, pitch, yaw) in radians
+    ///
+    /// Computed on first access and cached until `set_rotation_xyzw`.
     fn euler_angles(&self) -> [f64; 3] {
-        self.inner.euler_angles()
+        self.cached_euler_angles()
     }
 
     fn __repr__(&self) -> String {
@@ -367,69 +572,154 @@ impl StampedIsometry {
     }
 }
 
-/// Python callback observer wrapper
-/// This struct wraps a Python callable and implements the BufferObserver trait
-/// allowing Python functions to be registered as observers
-struct PyBufferObserver {
-    callback: Py<PyAny>,
-}
+/// Deliver a batch of core updates to a single Python observer.
+///
+/// Batch protocol: if the observer exposes `on_update_batch`, hand it the
+/// whole batch in one call as a list of
+/// `(from, to, StampedIsometry, TransformType)` tuples. This lets columnar
+/// observers (e.g. the Rerun logger) send their data in a single shot instead
+/// of one row at a time. Otherwise the plain callable is invoked once per
+/// transform. `items` holds the already-converted Python objects so they are
+/// only built once per batch, no matter how many observers are registered.
+fn dispatch_to_observer(
+    py: Python<'_>,
+    callback: &Bound<'_, PyAny>,
+    items: &[(String, String, Py<StampedIsometry>, TransformType)],
+) {
+    if let Ok(batch_cb) = callback.getattr("on_update_batch") {
+        let batch: Vec<_> = items
+            .iter()
+            .map(|(from, to, iso, kind)| (from.as_str(), to.as_str(), iso.clone_ref(py), *kind))
+            .collect();
+        if let Err(e) = batch_cb.call1((batch,)) {
+            eprintln!(
+                "Error calling Python observer callback (on_update_batch): {}",
+                e
+            );
+            e.print(py);
+        }
+        return;
+    }
 
-impl PyBufferObserver {
-    fn new(callback: Py<PyAny>) -> Self {
-        PyBufferObserver { callback }
+    for (from, to, iso, kind) in items {
+        if let Err(e) = callback.call1((from.as_str(), to.as_str(), iso.clone_ref(py), *kind)) {
+            eprintln!("Error calling Python observer callback: {}", e);
+            e.print(py);
+        }
     }
 }
 
-impl CoreBufferObserver for PyBufferObserver {
+/// Convert a batch of core updates into the Python objects handed to observers.
+///
+/// Every observer receives the same objects, so they are marked read-only.
+fn observer_items(
+    py: Python<'_>,
+    updates: &[CoreTransformUpdate],
+) -> PyResult<Vec<(String, String, Py<StampedIsometry>, TransformType)>> {
+    updates
+        .iter()
+        .map(|u| {
+            Ok((
+                u.from.clone(),
+                u.to.clone(),
+                Py::new(
+                    py,
+                    StampedIsometry {
+                        read_only: true,
+                        ..StampedIsometry::from(u.stamped_isometry.clone())
+                    },
+                )?,
+                TransformType::from(u.kind),
+            ))
+        })
+        .collect()
+}
+
+/// Fan-out observer shared by every Python observer of one [`BufferTree`].
+///
+/// A single instance is registered with the core buffer; Python observers are
+/// appended to the shared list. Each batch acquires the GIL once and converts
+/// the updates to Python objects once, then dispatches to all observers,
+/// instead of every observer doing both on its own.
+struct PyObserverFanout {
+    observers: Arc<Mutex<Vec<Py<PyAny>>>>,
+}
+
+impl CoreBufferObserver for PyObserverFanout {
     fn on_update(&self, updates: &[CoreTransformUpdate]) {
-        // Acquire the GIL once for the whole batch.
+        if !self.is_active() {
+            return;
+        }
         Python::attach(|py| {
-            let callback = self.callback.bind(py);
-
-            // Batch protocol: if the observer exposes `on_update_batch`, hand it
-            // the whole batch in one call as a list of
-            // `(from, to, StampedIsometry, TransformType)` tuples. This lets
-            // columnar observers (e.g. the Rerun logger) send their data in a
-            // single shot instead of one row at a time.
-            if let Ok(batch_cb) = callback.getattr("on_update_batch") {
-                let items: Vec<(String, String, StampedIsometry, TransformType)> = updates
-                    .iter()
-                    .map(|u| {
-                        (
-                            u.from.clone(),
-                            u.to.clone(),
-                            StampedIsometry::from(u.stamped_isometry.clone()),
-                            TransformType::from(u.kind),
-                        )
-                    })
-                    .collect();
-                if let Err(e) = batch_cb.call1((items,)) {
-                    eprintln!(
-                        "Error calling Python observer callback (on_update_batch): {}",
-                        e
-                    );
-                    e.print(py);
-                }
-                return;
-            }
-
-            // Otherwise call the plain callable once per transform.
-            for update in updates {
-                let py_transform = StampedIsometry::from(update.stamped_isometry.clone());
-                let py_kind = TransformType::from(update.kind);
-
-                if let Err(e) = callback.call1((
-                    update.from.clone(),
-                    update.to.clone(),
-                    py_transform,
-                    py_kind,
-                )) {
-                    eprintln!("Error calling Python observer callback: {}", e);
+            // Snapshot the list so observers can't deadlock by touching it.
+            let observers: Vec<Py<PyAny>> = self
+                .observers
+                .lock()
+                .unwrap()
+                .iter()
+                .map(|o| o.clone_ref(py))
+                .collect();
+            let items = match observer_items(py, updates) {
+                Ok(items) => items,
+                Err(e) => {
+                    eprintln!("Error converting transforms for Python observers: {}", e);
                     e.print(py);
+                    return;
                 }
+            };
+            for observer in &observers {
+                dispatch_to_observer(py, observer.bind(py), &items);
             }
         });
     }
+
+    /// Idle until the first Python observer is registered, so `update_by_id`
+    /// doesn't build notifications nobody receives.
+    fn is_active(&self) -> bool {
+        !self.observers.lock().unwrap().is_empty()
+    }
+}
+
+/// C observer callback accepted by `BufferTree.register_observer_cfunc`.
+///
+/// Arguments: NUL-terminated `from` and `to` frame names, a pointer to seven
+/// doubles `[x, y, z, qx, qy, qz, qw]`, the stamp in nanoseconds and the
+/// transform kind (`0` dynamic, `1` static). All pointers are only valid for
+/// the duration of the call.
+type CObserverFn = extern "C" fn(*const c_char, *const c_char, *const f64, i64, u8);
+
+/// Observer that forwards every update to a C function pointer.
+///
+/// No Python objects are created and no Python code runs per update. The
+/// function is still called on the thread doing the insert, which holds the
+/// GIL for the whole `update` / `update_many` call.
+struct CFuncObserver {
+    func: CObserverFn,
+}
+
+impl CoreBufferObserver for CFuncObserver {
+    fn on_update(&self, updates: &[CoreTransformUpdate]) {
+        for update in updates {
+            // Frame names with interior NULs cannot be passed as C strings.
+            let (Ok(from), Ok(to)) = (
+                CString::new(update.from.as_str()),
+                CString::new(update.to.as_str()),
+            ) else {
+                continue;
+            };
+            let iso = &update.stamped_isometry;
+            let t = iso.translation();
+            let r = iso.rotation();
+            let data = [t[0], t[1], t[2], r[0], r[1], r[2], r[3]];
+            (self.func)(
+                from.as_ptr(),
+                to.as_ptr(),
+                data.as_ptr(),
+                iso.stamp(),
+                update.kind as u8,
+            );
+        }
+    }
 }
 
 /// Python wrapper for BufferTree
@@ -437,15 +727,20 @@ impl CoreBufferObserver for PyBufferObserver {
 pub struct BufferTree {
     /// The underlying core buffer tree (public for inter-crate access)
     pub inner: CoreBufferTree,
+    /// Python observers, dispatched to by a single [`PyObserverFanout`]
+    observers: Arc<Mutex<Vec<Py<PyAny>>>>,
 }
 
 #[pymethods]
 impl BufferTree {
     #[new]
     pub fn new() -> Self {
-        BufferTree {
-            inner: CoreBufferTree::new(),
-        }
+        let observers = Arc::new(Mutex::new(Vec::new()));
+        let mut inner = CoreBufferTree::new();
+        inner.register_observer(Box::new(PyObserverFanout {
+            observers: Arc::clone(&observers),
+        }));
+        BufferTree { inner, observers }
     }
 
     /// Insert a single transform into the buffer.
@@ -457,15 +752,11 @@ impl BufferTree {
         &mut self,
         from: String,
         to: String,
-        stamped_isometry: StampedIsometry,
+        stamped_isometry: PyRef<'_, StampedIsometry>,
         kind: TransformType,
     ) -> PyResult<()> {
-        let core_iso = CoreStampedIsometry::new(
-            stamped_isometry.translation(),
-            stamped_isometry.rotation(),
-            stamped_isometry.stamp(),
-        );
-        let core_update = CoreTransformUpdate::new(from, to, core_iso, kind.into());
+        let core_update =
+            CoreTransformUpdate::new(from, to, stamped_isometry.inner.clone(), kind.into());
 
         self.inner
             .update(&[core_update])
@@ -473,6 +764,32 @@ impl BufferTree {
         Ok(())
     }
 
+    /// Intern a frame name and return its integer id.
+    ///
+    /// The id is stable for the lifetime of the buffer. Pass it to
+    /// `update_by_id` / `lookup_*_by_id` in hot loops to avoid re-hashing
+    /// the frame name strings on every call. Until a transform is inserted
+    /// on the frame, lookups still report it as not existing.
+    pub fn intern_frame(&mut self, name: &str) -> usize {
+        self.inner.intern_frame(name)
+    }
+
+    /// Insert a single transform between two frames given by interned ids.
+    ///
+    /// Equivalent to `update`, with `from_id` / `to_id` obtained from
+    /// `intern_frame`. Raises if an id was never interned.
+    pub fn update_by_id(
+        &mut self,
+        from_id: usize,
+        to_id: usize,
+        stamped_isometry: PyRef<'_, StampedIsometry>,
+        kind: TransformType,
+    ) -> PyResult<()> {
+        self.inner
+            .update_by_id(from_id, to_id, stamped_isometry.inner.clone(), kind.into())
+            .map_err(core_err_to_pyerr)
+    }
+
     /// Insert many transforms into the buffer in a single bulk call.
     ///
     /// `updates` is a list of `(from, to, stamped_isometry, kind)` tuples.
@@ -484,17 +801,12 @@ impl BufferTree {
     /// remain applied.
     pub fn update_batch(
         &mut self,
-        updates: Vec<(String, String, StampedIsometry, TransformType)>,
+        updates: Vec<(String, String, PyRef<'_, StampedIsometry>, TransformType)>,
     ) -> PyResult<()> {
         let core_updates: Vec<CoreTransformUpdate> = updates
             .into_iter()
             .map(|(from, to, stamped_isometry, kind)| {
-                let core_iso = CoreStampedIsometry::new(
-                    stamped_isometry.translation(),
-                    stamped_isometry.rotation(),
-                    stamped_isometry.stamp(),
-                );
-                CoreTransformUpdate::new(from, to, core_iso, kind.into())
+                CoreTransformUpdate::new(from, to, stamped_isometry.inner.clone(), kind.into())
             })
             .collect();
 
@@ -504,6 +816,84 @@ impl BufferTree {
         Ok(())
     }
 
+    /// Insert many transforms given as NumPy columns in a single bulk call.
+    ///
+    /// Row `i` inserts the edge `parents[i] -> children[i]`:
+    ///
+    /// * `transforms` - float64 array of shape `(N, 7)`, each row
+    ///   `[x, y, z, qx, qy, qz, qw]`
+    /// * `stamps` - int64 array of shape `(N,)`, nanoseconds since the Unix
+    ///   epoch (kept out of `transforms` because float64 cannot hold
+    ///   nanosecond epoch stamps exactly)
+    /// * `kinds` - uint8 array of shape `(N,)`, `0` for dynamic and `1` for
+    ///   static (the `TransformType` values)
+    ///
+    /// All rows are applied with one call into the core buffer, so observers
+    /// are notified once with the full batch. Like [`update_batch`] this is
+    /// fail-fast: rows before a rejected one remain applied.
+    pub fn update_many(
+        &mut self,
+        parents: Vec<String>,
+        children: Vec<String>,
+        transforms: PyReadonlyArray2<'_, f64>,
+        stamps: PyReadonlyArray1<'_, i64>,
+        kinds: PyReadonlyArray1<'_, u8>,
+    ) -> PyResult<()> {
+        let n = parents.len();
+        if children.len() != n {
+            return Err(PyValueError::new_err(format!(
+                "children must have the same length as parents ({}), got {}",
+                n,
+                children.len()
+            )));
+        }
+        if transforms.shape() != [n, 7] {
+            return Err(PyValueError::new_err(format!(
+                "transforms must have shape ({}, 7), got {:?}",
+                n,
+                transforms.shape()
+            )));
+        }
+        if stamps.shape() != [n] {
+            return Err(PyValueError::new_err(format!(
+                "stamps must have shape ({},), got {:?}",
+                n,
+                stamps.shape()
+            )));
+        }
+        if kinds.shape() != [n] {
+            return Err(PyValueError::new_err(format!(
+                "kinds must have shape ({},), got {:?}",
+                n,
+                kinds.shape()
+            )));
+        }
+
+        let t = transforms.as_array();
+        let stamps = stamps.as_array();
+        let kinds = kinds.as_array();
+        let mut core_updates = Vec::with_capacity(n);
+        for (i, (from, to)) in parents.into_iter().zip(children).enumerate() {
+            let kind = CoreTransformType::try_from(kinds[i]).map_err(|_| {
+                PyValueError::new_err(format!(
+                    "kinds[{}] must be 0 (dynamic) or 1 (static), got {}",
+                    i, kinds[i]
+                ))
+            })?;
+            let core_iso = CoreStampedIsometry::new(
+                [t[[i, 0]], t[[i, 1]], t[[i, 2]]],
+                [t[[i, 3]], t[[i, 4]], t[[i, 5]], t[[i, 6]]],
+                stamps[i],
+            );
+            core_updates.push(CoreTransformUpdate::new(from, to, core_iso, kind));
+        }
+
+        self.inner
+            .update(&core_updates)
+            .map_err(core_err_to_pyerr)?;
+        Ok(())
+    }
+
     /// Lookup the latest transform without any checks
     /// This can be used for static transforms or if the user does not care if the
     /// transform is still valid.
@@ -546,6 +936,76 @@ impl BufferTree {
         }
     }
 
+    /// Lookup the transform between two frames at many timestamps in one call.
+    ///
+    /// The frame chain is resolved once; each stamp then costs one binary
+    /// search per edge. Same interpolation and errors as `lookup_transform`;
+    /// the first stamp that cannot be served raises for the whole batch.
+    ///
+    /// # Arguments
+    /// * `from` - Source frame name
+    /// * `to` - Target frame name
+    /// * `stamps` - int64 numpy array of shape (N,), nanoseconds since Unix epoch
+    ///
+    /// Returns `(translations, rotations)`: float64 arrays of shape (N, 3)
+    /// and (N, 4), the rotations in xyzw order.
+    #[allow(clippy::type_complexity)]
+    pub fn lookup_transform_batch<'py>(
+        &self,
+        py: Python<'py>,
+        from: String,
+        to: String,
+        stamps: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<(Bound<'py, PyArray2<f64>>, Bound<'py, PyArray2<f64>>)> {
+        let times = contiguous_data(&stamps);
+        let results = self
+            .inner
+            .lookup_transform_batch(&from, &to, &times)
+            .map_err(core_err_to_pyerr)?;
+
+        let mut translations = Array2::<f64>::zeros((results.len(), 3));
+        let mut rotations = Array2::<f64>::zeros((results.len(), 4));
+        for (i, result) in results.iter().enumerate() {
+            let t = &result.isometry.translation.vector;
+            let q = &result.isometry.rotation.coords;
+            for k in 0..3 {
+                translations[[i, k]] = t[k];
+            }
+            for k in 0..4 {
+                rotations[[i, k]] = q[k];
+            }
+        }
+        Ok((translations.into_pyarray(py), rotations.into_pyarray(py)))
+    }
+
+    /// `lookup_latest_transform` for frames given by interned ids.
+    pub fn lookup_latest_transform_by_id(
+        &self,
+        from_id: usize,
+        to_id: usize,
+    ) -> PyResult<StampedIsometry> {
+        self.inner
+            .lookup_latest_transform_by_id(from_id, to_id)
+            .map(StampedIsometry::from)
+            .map_err(core_err_to_pyerr)
+    }
+
+    /// `lookup_transform` for frames given by interned ids.
+    ///
+    /// `time` follows the same int (ns) / float (s) dispatch as `lookup_transform`.
+    pub fn lookup_transform_by_id(
+        &self,
+        from_id: usize,
+        to_id: usize,
+        time: Bound<'_, PyAny>,
+    ) -> PyResult<StampedIsometry> {
+        let time_ns = stamp_to_ns(&time)?;
+        self.inner
+            .lookup_transform_by_id(from_id, to_id, time_ns)
+            .map(StampedIsometry::from)
+            .map_err(core_err_to_pyerr)
+    }
+
     /// Visualize the buffer tree as a DOT graph
     /// Can not use internal visualizer because we Store the nodes in self.index
     pub fn visualize(&self) -> String {
@@ -562,9 +1022,9 @@ impl BufferTree {
 
     /// Register a Python observer.
     ///
-    /// The observer is notified whenever transforms are inserted via `update`
-    /// or `update_batch`, and immediately receives the transforms already in
-    /// the buffer at registration time.
+    /// The observer is notified whenever transforms are inserted via `update`,
+    /// `update_by_id`, `update_batch` or `update_many`, and immediately
+    /// receives the transforms already in the buffer at registration time.
     ///
     /// Two protocols are supported:
     ///
@@ -577,6 +1037,10 @@ impl BufferTree {
     ///   callable invoked once per transform:
     ///   `callback(from: str, to: str, transform: StampedIsometry, kind: TransformType) -> None`
     ///
+    /// All observers receive the same `StampedIsometry` objects, so these are
+    /// read-only: their `set_*` methods raise. Use `copy.copy(transform)` to
+    /// get a copy that can be modified.
+    ///
     /// # Arguments
     /// * `callback` - A callable, or an object exposing `on_update_batch`
     ///
@@ -597,9 +1061,47 @@ impl BufferTree {
             ));
         }
 
-        // Create the observer wrapper and register it
-        let observer = PyBufferObserver::new(callback);
-        self.inner.register_observer(Box::new(observer));
+        // Replay the current buffer state to the new observer only, then add
+        // it to the shared fan-out list.
+        let replay = self.inner.snapshot();
+        if !replay.is_empty() {
+            let items = observer_items(py, &replay)?;
+            dispatch_to_observer(py, bound, &items);
+        }
+        self.observers.lock().unwrap().push(callback);
+        Ok(())
+    }
+
+    /// Register a native C function as an observer.
+    ///
+    /// `addr` is the address of a function with the C signature
+    /// `void(const char *from, const char *to, const double *xyz_qxyzw,
+    /// int64_t stamp_ns, uint8_t kind)`, e.g. the `.address` of a
+    /// `numba.cfunc` compiled with
+    /// `"void(CPointer(int8), CPointer(int8), CPointer(float64), int64, uint8)"`.
+    /// The callback is invoked once per transform directly from Rust, without
+    /// creating Python objects or going through the interpreter. It runs on
+    /// the inserting thread while that thread holds the GIL, so it does not
+    /// let updates run concurrently. Like `register_observer`, it immediately
+    /// receives the transforms already in the buffer.
+    ///
+    /// C observers are notified after all Python observers of the same batch,
+    /// regardless of the order in which they were registered.
+    ///
+    /// The caller must keep the compiled function alive for the lifetime of
+    /// the buffer; passing anything other than a function with exactly this
+    /// signature is undefined behaviour.
+    pub fn register_observer_cfunc(&mut self, addr: usize) -> PyResult<()> {
+        if addr == 0 {
+            return Err(PyValueError::new_err(
+                "addr must be the address of a C function, got NULL",
+            ));
+        }
+        // SAFETY: the caller guarantees `addr` points at a function with the
+        // `CObserverFn` signature (see the docstring above).
+        let func = unsafe { std::mem::transmute::<usize, CObserverFn>(addr) };
+        self.inner
+            .register_observer(Box::new(CFuncObserver { func }));
         Ok(())
     }
 }
@@ -628,6 +1130,140 @@ impl UrdfLoader {
     }
 }
 
+/// Convert roll/pitch/yaw angles to `[x, y, z, w]` quaternions.
+///
+/// `rpy` is a float64 array of shape `(..., 3)`; the result has shape
+/// `(..., 4)`. Uses the URDF convention (rotate about X by roll, then Y by
+/// pitch, then Z by yaw, all about fixed axes), the same one `UrdfLoader`
+/// applies to `<origin rpy="..."/>`.
+///
+/// Compiled into the extension module, so there is no JIT warm-up cost and
+/// the whole array is converted in one call.
+#[pyfunction]
+fn quaternion_from_euler<'py>(
+    py: Python<'py>,
+    rpy: PyReadonlyArrayDyn<'py, f64>,
+) -> PyResult<Bound<'py, PyArrayDyn<f64>>> {
+    let shape = rpy.shape();
+    if shape.last() != Some(&3) {
+        return Err(PyValueError::new_err(format!(
+            "rpy must have shape (..., 3), got {:?}",
+            shape
+        )));
+    }
+    let mut out_shape = shape.to_vec();
+    *out_shape.last_mut().unwrap() = 4;
+
+    let angles = contiguous_data(&rpy);
+    let mut out = Vec::with_capacity(angles.len() / 3 * 4);
+    for row in angles.chunks_exact(3) {
+        // Same expansion as `UnitQuaternion::from_euler_angles`, spelled out so
+        // each half-angle costs a single `sin_cos`.
+        let (sr, cr) = (row[0] * 0.5).sin_cos();
+        let (sp, cp) = (row[1] * 0.5).sin_cos();
+        let (sy, cy) = (row[2] * 0.5).sin_cos();
+        out.extend_from_slice(&[
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy,
+            cr * cp * cy + sr * sp * sy,
+        ]);
+    }
+
+    let array = ArrayD::from_shape_vec(IxDyn(&out_shape), out)
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    Ok(array.into_pyarray(py))
+}
+
+/// Number of `f64`s in a raw transform row: `[tx, ty, tz, qx, qy, qz, qw]`.
+const RAW_TRANSFORM_LEN: usize = 7;
+
+/// Interpolate two raw transform rows (linear translation, SLERP rotation)
+/// into `out`, with the same math `BufferTree.lookup_transform` uses.
+fn interpolate_raw_row(a: &[f64], b: &[f64], alpha: f64, out: &mut [f64]) {
+    let iso_a = CoreStampedIsometry::new([a[0], a[1], a[2]], [a[3], a[4], a[5], a[6]], 0).isometry;
+    let iso_b = CoreStampedIsometry::new([b[0], b[1], b[2]], [b[3], b[4], b[5], b[6]], 0).isometry;
+    let iso = lerp_slerp(&iso_a, &iso_b, alpha);
+    out[..3].copy_from_slice(iso.translation.vector.as_slice());
+    out[3..].copy_from_slice(iso.rotation.coords.as_slice());
+}
+
+/// C ABI entry point for [`interpolate_raw`], for `numba.cfunc` / `ctypes`.
+///
+/// Its address is exported to Python as `schiebung.INTERPOLATE_RAW_ADDR`, so
+/// JIT-compiled code can call it without touching any Python object.
+///
+/// # Safety
+///
+/// `a` and `b` must each point to 7 readable `f64`s and `out` to 7 writable
+/// `f64`s laid out as `[tx, ty, tz, qx, qy, qz, qw]`. `out` may alias neither
+/// input.
+#[no_mangle]
+pub unsafe extern "C" fn schiebung_interpolate_raw(
+    a: *const f64,
+    b: *const f64,
+    alpha: f64,
+    out: *mut f64,
+) {
+    let (a, b, out) = unsafe {
+        (
+            std::slice::from_raw_parts(a, RAW_TRANSFORM_LEN),
+            std::slice::from_raw_parts(b, RAW_TRANSFORM_LEN),
+            std::slice::from_raw_parts_mut(out, RAW_TRANSFORM_LEN),
+        )
+    };
+    interpolate_raw_row(a, b, alpha, out);
+}
+
+/// Interpolate between raw transforms without going through `StampedIsometry`.
+///
+/// `a` and `b` are float64 arrays of shape `(..., 7)` holding
+/// `[tx, ty, tz, qx, qy, qz, qw]` rows (the `update_many` layout); the
+/// result has the same shape. `alpha` is the weight of `b`: 0 returns `a`,
+/// 1 returns `b`. Translation is interpolated linearly and rotation by SLERP
+/// along the shortest arc, exactly as in `BufferTree.lookup_transform`.
+///
+/// For calls from inside `numba.njit` code use the C function at
+/// `INTERPOLATE_RAW_ADDR` instead: `void (const double *a, const double *b,
+/// double alpha, double *out)` on a single row.
+#[pyfunction]
+fn interpolate_raw<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArrayDyn<'py, f64>,
+    b: PyReadonlyArrayDyn<'py, f64>,
+    alpha: f64,
+) -> PyResult<Bound<'py, PyArrayDyn<f64>>> {
+    let shape = a.shape().to_vec();
+    if shape.last() != Some(&RAW_TRANSFORM_LEN) {
+        return Err(PyValueError::new_err(format!(
+            "a must have shape (..., 7), got {:?}",
+            shape
+        )));
+    }
+    if b.shape() != shape.as_slice() {
+        return Err(PyValueError::new_err(format!(
+            "b must have the same shape as a ({:?}), got {:?}",
+            shape,
+            b.shape()
+        )));
+    }
+
+    let rows_a = contiguous_data(&a);
+    let rows_b = contiguous_data(&b);
+    let mut out = vec![0.0; rows_a.len()];
+    for ((row_a, row_b), row_out) in rows_a
+        .chunks_exact(RAW_TRANSFORM_LEN)
+        .zip(rows_b.chunks_exact(RAW_TRANSFORM_LEN))
+        .zip(out.chunks_exact_mut(RAW_TRANSFORM_LEN))
+    {
+        interpolate_raw_row(row_a, row_b, alpha, row_out);
+    }
+
+    let array = ArrayD::from_shape_vec(IxDyn(&shape), out)
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    Ok(array.into_pyarray(py))
+}
+
 /// Python bindings for schiebung-core
 #[pymodule]
 fn schiebung(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
@@ -636,5 +1272,11 @@ fn schiebung(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<TransformType>()?;
     m.add_class::<TfError>()?;
     m.add_class::<UrdfLoader>()?;
+    m.add_function(wrap_pyfunction!(quaternion_from_euler, m)?)?;
+    m.add_function(wrap_pyfunction!(interpolate_raw, m)?)?;
+    m.add(
+        "INTERPOLATE_RAW_ADDR",
+        schiebung_interpolate_raw as *const () as usize,
+    )?;
     Ok(())
 }
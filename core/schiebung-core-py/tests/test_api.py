@@ -1,3 +1,5 @@
+import math
+import numpy as np
 import pytest
 import schiebung
 import tempfile
@@ -52,6 +54,22 @@ def test_dynamic_lookup_interpolation():
     res = buf.lookup_transform("odom", "base_link", 5.0)
     assert res.translation() == [5.0, 0.0, 0.0]
 
+def test_repeated_lookups_on_same_pair():
+    buf = BufferTree()
+    buf.update("map", "odom", StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0), TransformType.Static)
+    buf.update("odom", "base", StampedIsometry([0.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0), TransformType.Static)
+
+    first = buf.lookup_latest_transform("base", "map")
+    for _ in range(1000):
+        again = buf.lookup_latest_transform("base", "map")
+        assert again.translation() == first.translation()
+        assert again.rotation() == first.rotation()
+
+    # A new edge changes the graph; lookups through it still resolve.
+    buf.update("map", "world", StampedIsometry([0.0, 0.0, 3.0], [0.0, 0.0, 0.0, 1.0], 0), TransformType.Static)
+    assert buf.lookup_latest_transform("base", "map").translation() == first.translation()
+    assert buf.lookup_latest_transform("base", "world").translation() == [-1.0, -2.0, 3.0]
+
 def test_lookup_exceptions():
     buf = BufferTree()
 
@@ -92,6 +110,154 @@ def test_cycle_detection():
     with pytest.raises(ValueError, match="InvalidGraph"):
          buf.update("C", "A", t, TransformType.Static)
 
+def test_stamped_isometry_in_place_setters():
+    iso = StampedIsometry.identity()
+    assert iso.translation() == [0.0, 0.0, 0.0]
+    assert iso.rotation() == [0.0, 0.0, 0.0, 1.0]
+    assert iso.stamp() == 0
+
+    iso.set_translation(1.0, 2.0, 3.0)
+    iso.set_rotation_xyzw(0.0, 0.0, 0.0, 2.0)  # normalized on write
+    iso.set_stamp_ns(42)
+    assert iso.translation() == [1.0, 2.0, 3.0]
+    assert iso.rotation() == [0.0, 0.0, 0.0, 1.0]
+    assert iso.stamp() == 42
+
+def test_euler_angles_cache_follows_rotation_setter():
+    iso = StampedIsometry.identity()
+    assert iso.euler_angles() == [0.0, 0.0, 0.0]
+    assert iso.euler_angles() == [0.0, 0.0, 0.0]
+
+    # yaw of pi/2
+    iso.set_rotation_xyzw(0.0, 0.0, math.sqrt(0.5), math.sqrt(0.5))
+    roll, pitch, yaw = iso.euler_angles()
+    assert yaw == pytest.approx(math.pi / 2)
+    assert list(iso.as_euler_angles()) == iso.euler_angles()
+
+def test_update_copies_reused_isometry():
+    buf = BufferTree()
+    iso = StampedIsometry.identity()
+    for i in range(3):
+        iso.set_translation(float(i), 0.0, 0.0)
+        iso.set_stamp_ns(i)
+        buf.update("A", "B", iso, TransformType.Dynamic)
+    # Mutating the prototype after insert must not change stored samples.
+    iso.set_translation(100.0, 0.0, 0.0)
+    assert buf.lookup_transform("A", "B", 1).translation() == [1.0, 0.0, 0.0]
+    assert buf.lookup_latest_transform("A", "B").translation() == [2.0, 0.0, 0.0]
+
+def test_interned_frame_ids():
+    buf = BufferTree()
+    a = buf.intern_frame("A")
+    b = buf.intern_frame("B")
+    assert buf.intern_frame("A") == a
+    assert a != b
+
+    buf.update_by_id(a, b, StampedIsometry([0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 10.0),
+                     TransformType.Dynamic)
+    buf.update_by_id(a, b, StampedIsometry([10.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 20.0),
+                     TransformType.Dynamic)
+
+    assert buf.lookup_latest_transform_by_id(a, b).translation() == [10.0, 0.0, 0.0]
+    assert buf.lookup_transform_by_id(a, b, 15.0).translation() == [5.0, 0.0, 0.0]
+    # Ids and names address the same edge.
+    assert buf.lookup_transform("A", "B", 15.0).translation() == [5.0, 0.0, 0.0]
+
+    with pytest.raises(ValueError, match="CouldNotFindTransform"):
+        buf.lookup_latest_transform_by_id(a, 1000)
+
+    # Interning alone does not make a frame exist for lookups.
+    c = buf.intern_frame("C")
+    with pytest.raises(ValueError, match="Target frame 'C' does not exist"):
+        buf.lookup_latest_transform("A", "C")
+    with pytest.raises(ValueError, match="Target frame 'C' does not exist"):
+        buf.lookup_transform_by_id(a, c, 15.0)
+
+def test_update_many_inserts_every_row():
+    buf = BufferTree()
+    transforms = np.array([
+        [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+        [0.0, 2.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+        [0.0, 0.0, 3.0, 0.0, 0.0, 0.0, 1.0],
+    ])
+    stamps = np.array([10, 10, 20], dtype=np.int64)
+    kinds = np.array([1, 0, 0], dtype=np.uint8)
+    buf.update_many(["a", "b", "b"], ["b", "c", "c"], transforms, stamps, kinds)
+
+    assert buf.lookup_latest_transform("a", "b").translation() == [1.0, 0.0, 0.0]
+    latest = buf.lookup_latest_transform("b", "c")
+    assert latest.translation() == [0.0, 0.0, 3.0]
+    assert latest.stamp() == 20
+    mid = buf.lookup_transform("b", "c", 15)
+    np.testing.assert_allclose(mid.as_translation(), [0.0, 1.0, 1.5])
+
+def test_update_many_notifies_batch_observer_once():
+    class Recorder:
+        def __init__(self):
+            self.batches = []
+
+        def on_update_batch(self, batch):
+            self.batches.append(batch)
+
+    buf = BufferTree()
+    rec = Recorder()
+    buf.register_observer(rec)
+    n = 4
+    transforms = np.zeros((n, 7))
+    transforms[:, 6] = 1.0
+    buf.update_many(
+        ["root"] * n,
+        [f"child_{i}" for i in range(n)],
+        transforms,
+        np.zeros(n, dtype=np.int64),
+        np.full(n, 1, dtype=np.uint8),
+    )
+    assert len(rec.batches) == 1
+    assert len(rec.batches[0]) == n
+    assert rec.batches[0][0][3] == TransformType.Static
+
+def test_update_many_rejects_bad_input():
+    buf = BufferTree()
+    ok = np.array([[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]])
+    stamps = np.zeros(1, dtype=np.int64)
+    kinds = np.zeros(1, dtype=np.uint8)
+    with pytest.raises(ValueError, match="children"):
+        buf.update_many(["a"], [], ok, stamps, kinds)
+    with pytest.raises(ValueError, match=r"shape \(1, 7\)"):
+        buf.update_many(["a"], ["b"], np.zeros((1, 8)), stamps, kinds)
+    with pytest.raises(ValueError, match=r"kinds\[0\]"):
+        buf.update_many(["a"], ["b"], ok, stamps, np.array([7], dtype=np.uint8))
+
+def test_lookup_transform_batch_10k_stamps():
+    buf = BufferTree()
+    n_samples = 11
+    stamps = np.arange(n_samples, dtype=np.int64) * 1_000_000_000
+    buf.update_many(
+        ["world"] * n_samples,
+        ["robot"] * n_samples,
+        np.column_stack([np.arange(n_samples, dtype=np.float64),
+                         np.zeros((n_samples, 5)),
+                         np.ones(n_samples)]),
+        stamps,
+        np.zeros(n_samples, dtype=np.uint8),
+    )
+
+    queries = np.linspace(0, 10_000_000_000, 10_000).astype(np.int64)
+    translations, rotations = buf.lookup_transform_batch("world", "robot", queries)
+    assert translations.shape == (10_000, 3) and translations.dtype == np.float64
+    assert rotations.shape == (10_000, 4) and rotations.dtype == np.float64
+    np.testing.assert_allclose(translations[:, 0], queries / 1e9)
+    np.testing.assert_allclose(rotations, np.tile([0.0, 0.0, 0.0, 1.0], (10_000, 1)))
+
+    single = buf.lookup_transform("world", "robot", int(queries[1234]))
+    np.testing.assert_allclose(translations[1234], single.translation())
+
+def test_lookup_transform_batch_raises_for_out_of_range_stamp():
+    buf = BufferTree()
+    buf.update("world", "robot", StampedIsometry([0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0), TransformType.Dynamic)
+    with pytest.raises(ValueError):
+        buf.lookup_transform_batch("world", "robot", np.array([0, 5], dtype=np.int64))
+
 def test_urdf_loader_creation():
     """Test that UrdfLoader can be instantiated"""
     loader = UrdfLoader()
@@ -1,12 +1,27 @@
 """NumPy interop for StampedIsometry: as_matrix / as_translation /
-as_quaternion / __array__ / from_matrix round-trip."""
+as_quaternion / as_euler_angles / __array__ / from_matrix round-trip /
+from_buffers / from_arrays, plus the array functions quaternion_from_euler
+and interpolate_raw."""
 
+import ctypes
 import math
 
 import numpy as np
 import pytest
 
-from schiebung import StampedIsometry
+from schiebung import (
+    INTERPOLATE_RAW_ADDR,
+    BufferTree,
+    StampedIsometry,
+    TransformType,
+    interpolate_raw,
+    quaternion_from_euler,
+)
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
 
 
 def _identity_iso(stamp_ns: int = 0) -> StampedIsometry:
@@ -42,6 +57,26 @@ def test_as_translation_and_as_quaternion_shapes():
     np.testing.assert_array_equal(q, [0.0, 0.0, 0.0, 1.0])
 
 
+def test_as_euler_angles_matches_list_getter():
+    half = math.sqrt(0.5)
+    iso = StampedIsometry([0.0, 0.0, 0.0], [0.0, 0.0, half, half], 0)
+    rpy = iso.as_euler_angles()
+    assert isinstance(rpy, np.ndarray) and rpy.shape == (3,) and rpy.dtype == np.float64
+    np.testing.assert_array_equal(rpy, iso.euler_angles())
+    np.testing.assert_allclose(rpy, [0.0, 0.0, math.pi / 2], atol=1e-12)
+
+
+def test_as_translation_is_detached_from_setters():
+    iso = StampedIsometry.identity()
+    t = iso.as_translation()
+    q = iso.as_quaternion()
+    iso.set_translation(1.0, 2.0, 3.0)
+    iso.set_rotation_xyzw(0.0, 0.0, 1.0, 0.0)
+    np.testing.assert_array_equal(t, [0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(q, [0.0, 0.0, 0.0, 1.0])
+    np.testing.assert_array_equal(iso.as_translation(), [1.0, 2.0, 3.0])
+
+
 def test_array_protocol_returns_matrix():
     """np.asarray(iso) and np.array(iso) both go through __array__."""
     iso = _translation_iso(0.5, 0.0, 1.0)
@@ -123,3 +158,177 @@ def test_from_matrix_accepts_float_seconds():
 def test_from_matrix_accepts_int_nanoseconds():
     iso = StampedIsometry.from_matrix(np.eye(4), stamp=42)
     assert iso.stamp() == 42
+
+
+def test_from_buffers_matches_list_constructor():
+    translation = np.array([1.0, 2.0, 3.0])
+    rotation = np.array([0.0, 0.0, 0.0, 1.0])
+    iso = StampedIsometry.from_buffers(translation, rotation, 42)
+    ref = StampedIsometry([1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 1.0], 42)
+    assert iso.stamp() == 42
+    np.testing.assert_array_equal(iso.as_matrix(), ref.as_matrix())
+
+
+def test_from_buffers_copies_out_of_reused_buffers():
+    """Overwriting the buffers after construction must not leak into the iso."""
+    translation = np.zeros(3)
+    rotation = np.array([0.0, 0.0, 0.0, 1.0])
+    translation[0] = 1.0
+    first = StampedIsometry.from_buffers(translation, rotation, 1.0)
+    translation[0] = 2.0
+    second = StampedIsometry.from_buffers(translation, rotation, 2.0)
+    assert first.translation() == [1.0, 0.0, 0.0]
+    assert second.translation() == [2.0, 0.0, 0.0]
+    assert second.stamp() == 2_000_000_000
+
+
+def test_from_buffers_rejects_wrong_shape():
+    with pytest.raises(ValueError, match=r"shape \(3,\)"):
+        StampedIsometry.from_buffers(np.zeros(4), np.array([0.0, 0.0, 0.0, 1.0]), 0)
+    with pytest.raises(ValueError, match=r"shape \(4,\)"):
+        StampedIsometry.from_buffers(np.zeros(3), np.zeros(3), 0)
+
+
+def test_from_arrays_matches_list_constructor():
+    translations = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    half = math.sqrt(0.5)
+    rotations = np.array([[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, half, half]])
+    stamps = np.array([10, 20], dtype=np.int64)
+
+    isos = StampedIsometry.from_arrays(translations, rotations, stamps)
+    assert len(isos) == 2
+    for iso, t, q, stamp in zip(isos, translations, rotations, stamps):
+        ref = StampedIsometry(t.tolist(), q.tolist(), int(stamp))
+        assert iso.stamp() == stamp
+        np.testing.assert_allclose(iso.as_matrix(), ref.as_matrix())
+
+
+def test_from_arrays_empty():
+    isos = StampedIsometry.from_arrays(
+        np.zeros((0, 3)), np.zeros((0, 4)), np.zeros(0, dtype=np.int64)
+    )
+    assert isos == []
+
+
+def test_from_arrays_rejects_mismatched_shapes():
+    stamps = np.zeros(2, dtype=np.int64)
+    with pytest.raises(ValueError, match=r"translations must have shape \(2, 3\)"):
+        StampedIsometry.from_arrays(np.zeros((3, 3)), np.zeros((2, 4)), stamps)
+    with pytest.raises(ValueError, match=r"rotations must have shape \(2, 4\)"):
+        StampedIsometry.from_arrays(np.zeros((2, 3)), np.zeros((2, 3)), stamps)
+
+
+def test_quaternion_from_euler_single_axis():
+    half = math.sqrt(0.5)
+    q = quaternion_from_euler(np.array([[math.pi / 2, 0.0, 0.0],
+                                        [0.0, math.pi / 2, 0.0],
+                                        [0.0, 0.0, math.pi / 2]]))
+    assert q.shape == (3, 4)
+    np.testing.assert_allclose(q, [[half, 0.0, 0.0, half],
+                                   [0.0, half, 0.0, half],
+                                   [0.0, 0.0, half, half]], atol=1e-12)
+
+
+def test_quaternion_from_euler_keeps_leading_shape_and_round_trips():
+    rng = np.random.default_rng(0)
+    rpy = rng.uniform(-1.2, 1.2, size=(5, 2, 3))  # pitch away from gimbal lock
+    q = quaternion_from_euler(rpy)
+    assert q.shape == (5, 2, 4)
+    # Same convention as StampedIsometry.euler_angles().
+    for angles, quat in zip(rpy.reshape(-1, 3), q.reshape(-1, 4)):
+        iso = StampedIsometry([0.0, 0.0, 0.0], quat.tolist(), 0)
+        np.testing.assert_allclose(iso.euler_angles(), angles, atol=1e-9)
+
+
+def test_quaternion_from_euler_reads_transposed_angle_columns():
+    rng = np.random.default_rng(1)
+    roll, pitch, yaw = rng.uniform(-1.2, 1.2, size=(3, 8))
+    rpy = np.array([roll, pitch, yaw]).T  # Fortran-ordered (8, 3)
+    assert not rpy.flags.c_contiguous
+    np.testing.assert_allclose(
+        quaternion_from_euler(rpy), quaternion_from_euler(np.ascontiguousarray(rpy)), atol=1e-12
+    )
+
+
+def test_quaternion_from_euler_rejects_wrong_shape():
+    with pytest.raises(ValueError, match=r"\(\.\.\., 3\)"):
+        quaternion_from_euler(np.zeros((2, 4)))
+
+
+# Raw layout: [tx, ty, tz, qx, qy, qz, qw]
+_RAW_A = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+_RAW_B = np.array([10.0, 0.0, 0.0, 0.0, 0.0, math.sin(0.5), math.cos(0.5)])
+
+
+def _lookup_reference(alpha: float) -> np.ndarray:
+    """Interpolate _RAW_A -> _RAW_B through BufferTree.lookup_transform."""
+    buf = BufferTree()
+    for raw, stamp in ((_RAW_A, 0), (_RAW_B, 1_000_000_000)):
+        iso = StampedIsometry(raw[:3].tolist(), raw[3:].tolist(), stamp)
+        buf.update("world", "robot", iso, TransformType.Dynamic)
+    iso = buf.lookup_transform("world", "robot", int(alpha * 1_000_000_000))
+    return np.concatenate([iso.as_translation(), iso.as_quaternion()])
+
+
+def test_interpolate_raw_matches_lookup_transform():
+    for alpha in (0.0, 0.25, 0.5, 1.0):
+        np.testing.assert_allclose(
+            interpolate_raw(_RAW_A, _RAW_B, alpha), _lookup_reference(alpha), atol=1e-12
+        )
+
+
+def test_interpolate_raw_keeps_leading_shape():
+    a = np.tile(_RAW_A, (2, 3, 1))
+    b = np.tile(_RAW_B, (2, 3, 1))
+    out = interpolate_raw(a, b, 0.5)
+    assert out.shape == (2, 3, 7)
+    np.testing.assert_allclose(out[1, 2], interpolate_raw(_RAW_A, _RAW_B, 0.5))
+
+
+def test_interpolate_raw_reads_fortran_ordered_rows():
+    a = np.stack([_RAW_A, _RAW_A + [1.0, 2.0, 3.0, 0, 0, 0, 0]])
+    b = np.stack([_RAW_B, _RAW_B + [0.0, -1.0, 5.0, 0, 0, 0, 0]])
+    expected = interpolate_raw(a, b, 0.25)
+    out = interpolate_raw(np.asfortranarray(a), np.asfortranarray(b), 0.25)
+    np.testing.assert_allclose(out, expected, atol=1e-12)
+
+
+def test_interpolate_raw_rejects_wrong_shape():
+    with pytest.raises(ValueError, match=r"shape \(\.\.\., 7\)"):
+        interpolate_raw(np.zeros(6), np.zeros(6), 0.5)
+    with pytest.raises(ValueError, match="same shape"):
+        interpolate_raw(np.zeros((2, 7)), np.zeros((3, 7)), 0.5)
+
+
+_C_DOUBLE_P = ctypes.POINTER(ctypes.c_double)
+_C_INTERPOLATE_RAW = ctypes.CFUNCTYPE(
+    None, _C_DOUBLE_P, _C_DOUBLE_P, ctypes.c_double, _C_DOUBLE_P
+)(INTERPOLATE_RAW_ADDR)
+
+
+def test_interpolate_raw_c_abi_via_ctypes():
+    out = np.empty(7)
+    _C_INTERPOLATE_RAW(
+        _RAW_A.ctypes.data_as(_C_DOUBLE_P),
+        _RAW_B.ctypes.data_as(_C_DOUBLE_P),
+        0.5,
+        out.ctypes.data_as(_C_DOUBLE_P),
+    )
+    np.testing.assert_allclose(out, _lookup_reference(0.5), atol=1e-12)
+
+
+@pytest.mark.skipif(numba is None, reason="numba not installed")
+def test_interpolate_raw_c_abi_inside_njit():
+    c_interpolate = _C_INTERPOLATE_RAW
+
+    @numba.njit
+    def sweep(a, b, alphas):
+        out = np.empty((alphas.shape[0], 7))
+        for i in range(alphas.shape[0]):
+            c_interpolate(a.ctypes, b.ctypes, alphas[i], out[i].ctypes)
+        return out
+
+    alphas = np.linspace(0.0, 1.0, 5)
+    out = sweep(_RAW_A, _RAW_B, alphas)
+    for row, alpha in zip(out, alphas):
+        np.testing.assert_allclose(row, _lookup_reference(alpha), atol=1e-12)
@@ -1,4 +1,7 @@
 """Test Python observer callback functionality."""
+import copy
+import ctypes
+
 import pytest
 from schiebung import BufferTree, StampedIsometry, TransformType
 
@@ -88,6 +91,52 @@ def test_multiple_observers():
     assert calls2[0] == ("a", "b")
 
 
+def test_late_observer_replay_does_not_renotify_existing():
+    """Replaying the buffer to a new observer leaves earlier observers untouched."""
+    buf = BufferTree()
+
+    early = []
+    late = []
+
+    buf.register_observer(lambda f, t, tr, k: early.append((f, t)))
+    buf.update("a", "b", StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0.0),
+               TransformType.Static)
+
+    buf.register_observer(lambda f, t, tr, k: late.append((f, t)))
+    assert early == [("a", "b")]
+    assert late == [("a", "b")]
+
+    buf.update("b", "c", StampedIsometry([0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0.0),
+               TransformType.Static)
+    assert early == [("a", "b"), ("b", "c")]
+    assert late == [("a", "b"), ("b", "c")]
+
+
+def test_observer_cannot_mutate_shared_transform():
+    """Observers share one StampedIsometry per update, so it is read-only."""
+    buf = BufferTree()
+    copies = []
+    seen = []
+
+    def mutating_observer(from_frame, to_frame, transform, kind):
+        with pytest.raises(ValueError, match="read-only"):
+            transform.set_translation(9.0, 9.0, 9.0)
+        mutable = copy.copy(transform)
+        mutable.set_translation(9.0, 9.0, 9.0)
+        copies.append(mutable.translation())
+
+    def reading_observer(from_frame, to_frame, transform, kind):
+        seen.append(transform.translation())
+
+    buf.register_observer(mutating_observer)
+    buf.register_observer(reading_observer)
+    buf.update("a", "b", StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0.0),
+               TransformType.Static)
+
+    assert copies == [[9.0, 9.0, 9.0]]
+    assert seen == [[1.0, 0.0, 0.0]]
+
+
 def test_observer_must_be_callable():
     """Test that non-callable objects are rejected."""
     buf = BufferTree()
@@ -133,3 +182,58 @@ def test_observer_exception_handling():
     t = StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0.0)
     # This should complete successfully
     buf.update("a", "b", t, TransformType.Static)
+
+
+C_OBSERVER = ctypes.CFUNCTYPE(
+    None,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.c_int64,
+    ctypes.c_uint8,
+)
+
+
+def test_cfunc_observer_receives_raw_transform():
+    """A C function pointer observer gets names, [xyz, qxyzw], stamp and kind."""
+    calls = []
+
+    @C_OBSERVER
+    def observer(from_frame, to_frame, data, stamp_ns, kind):
+        calls.append((from_frame.decode(), to_frame.decode(),
+                      [data[i] for i in range(7)], stamp_ns, kind))
+
+    buf = BufferTree()
+    buf.update("a", "b", StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 5),
+               TransformType.Static)
+    buf.register_observer_cfunc(ctypes.cast(observer, ctypes.c_void_p).value)
+    buf.update("b", "c", StampedIsometry([0.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0], 7),
+               TransformType.Dynamic)
+
+    assert calls == [
+        ("a", "b", [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0], 5, 1),
+        ("b", "c", [0.0, 2.0, 0.0, 0.0, 0.0, 0.0, 1.0], 7, 0),
+    ]
+
+
+def test_cfunc_observer_rejects_null():
+    buf = BufferTree()
+    with pytest.raises(ValueError, match="NULL"):
+        buf.register_observer_cfunc(0)
+
+
+def test_cfunc_observer_runs_after_python_observers():
+    """C observers fire after every Python observer, whatever the registration order."""
+    order = []
+
+    @C_OBSERVER
+    def observer(from_frame, to_frame, data, stamp_ns, kind):
+        order.append("c")
+
+    buf = BufferTree()
+    buf.register_observer_cfunc(ctypes.cast(observer, ctypes.c_void_p).value)
+    buf.register_observer(lambda f, t, tr, k: order.append("py"))
+    buf.update("a", "b", StampedIsometry([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0),
+               TransformType.Static)
+
+    assert order == ["py", "c"]
@@ -3,6 +3,7 @@ use std::collections::VecDeque;
 use std::fs::File;
 use std::io::Write;
 use std::process::Command;
+use std::sync::{Arc, PoisonError, RwLock};
 
 use nalgebra::geometry::Isometry3;
 use petgraph::algo::is_cyclic_undirected;
@@ -10,14 +11,20 @@ use petgraph::graphmap::DiGraphMap;
 
 use crate::config::{get_config, BufferConfig};
 use crate::error::TfError;
+use crate::interpolation::lerp_slerp;
 use crate::types::{StampedIsometry, TransformType, TransformUpdate};
 
 /// The TransformHistory keeps track of a single transform between two frames
 /// Update pushes a new StampedTransform to the end, if the history reaches it's max length
 /// The oldest transform is removed.
+///
+/// Samples are stored as two parallel columns: the binary search at lookup
+/// time only walks the densely packed `stamps`, and only the two isometries
+/// bracketing the requested time are read.
 #[derive(Debug)]
 struct TransformHistory {
-    history: VecDeque<StampedIsometry>,
+    stamps: VecDeque<i64>,
+    isometries: VecDeque<Isometry3<f64>>,
     kind: TransformType,
     /// Buffer window in nanoseconds
     buffer_window: i64,
@@ -26,62 +33,93 @@ struct TransformHistory {
 impl TransformHistory {
     pub fn new(kind: TransformType, buffer_window_secs: f64) -> Self {
         TransformHistory {
-            history: VecDeque::new(),
+            stamps: VecDeque::new(),
+            isometries: VecDeque::new(),
             kind,
             buffer_window: (buffer_window_secs * 1_000_000_000.0) as i64,
         }
     }
 
+    /// Number of samples currently held.
+    pub fn len(&self) -> usize {
+        self.stamps.len()
+    }
+
+    /// The most recent sample, if any.
+    pub fn latest(&self) -> Option<StampedIsometry> {
+        Some(StampedIsometry {
+            isometry: *self.isometries.back()?,
+            stamp: *self.stamps.back()?,
+        })
+    }
+
+    /// Every sample, oldest first.
+    pub fn iter(&self) -> impl Iterator<Item = StampedIsometry> + '_ {
+        self.stamps
+            .iter()
+            .zip(&self.isometries)
+            .map(|(&stamp, &isometry)| StampedIsometry { isometry, stamp })
+    }
+
     pub fn update(&mut self, stamped_isometry: StampedIsometry) {
-        self.history.push_back(stamped_isometry);
-        if (self.history.back().unwrap().stamp - self.history.front().unwrap().stamp)
-            > self.buffer_window
-        {
-            self.history.pop_front();
+        // A static edge only ever answers with its latest sample, so keep
+        // exactly one instead of growing a window nobody searches.
+        if let TransformType::Static = self.kind {
+            self.stamps.clear();
+            self.isometries.clear();
+        }
+        self.stamps.push_back(stamped_isometry.stamp);
+        self.isometries.push_back(stamped_isometry.isometry);
+        if (self.stamps.back().unwrap() - self.stamps.front().unwrap()) > self.buffer_window {
+            self.stamps.pop_front();
+            self.isometries.pop_front();
         }
     }
 
     pub fn interpolate_isometry_at_time(&self, time: i64) -> Result<Isometry3<f64>, TfError> {
         match self.kind {
+            // Static edges are time-independent: no search, no interpolation.
             TransformType::Static => {
-                return Ok(self.history.back().unwrap().isometry);
+                return Ok(*self.isometries.back().unwrap());
             }
             TransformType::Dynamic => {
-                if self.history.len() < 2 {
+                if self.len() < 2 {
                     return Err(TfError::CouldNotFindTransform(format!(
                         "Not enough history to interpolate. Len: {}",
-                        self.history.len()
+                        self.len()
                     ))); // Not enough elements
                 }
 
-                let history = &self.history;
-                let idx = history.binary_search_by(|entry| entry.stamp.cmp(&time));
+                let stamps = &self.stamps;
+                let idx = stamps.binary_search(&time);
 
                 match idx {
                     Ok(i) => {
-                        return Ok(history[i].isometry);
+                        return Ok(self.isometries[i]);
                     }
                     Err(i) => {
                         // Not found, i is the insertion point
                         if i == 0 {
                             return Err(TfError::AttemptedLookupInPast(format!(
                                 "Time {} is before the oldest transform at {}",
-                                time, history[0].stamp
+                                time, stamps[0]
                             )));
                         }
-                        if i >= history.len() {
+                        if i >= stamps.len() {
                             return Err(TfError::AttemptedLookUpInFuture(format!(
                                 "Time {} is after the newest transform at {}",
                                 time,
-                                history[history.len() - 1].stamp
+                                stamps[stamps.len() - 1]
                             )));
                         } else {
                             // Calculate weight as f64 for interpolation
-                            let dt = (history[i].stamp - history[i - 1].stamp) as f64;
-                            let weight = (time - history[i - 1].stamp) as f64 / dt;
-                            return Ok(history[i - 1]
-                                .isometry
-                                .lerp_slerp(&history[i].isometry, weight));
+                            let dt = (stamps[i] - stamps[i - 1]) as f64;
+                            let weight = (time - stamps[i - 1]) as f64 / dt;
+                            return Ok(lerp_slerp(
+                                &self.isometries[i - 1],
+                                &self.isometries[i],
+                                weight,
+                            ));
                         }
                     }
                 }
@@ -171,6 +209,15 @@ impl NodeIndex {
 pub trait BufferObserver: Send + Sync {
     /// Handle a batch of transforms that was just inserted into the buffer.
     fn on_update(&self, updates: &[TransformUpdate]);
+
+    /// Whether the observer currently wants to be notified at all.
+    ///
+    /// Observers that multiplex other subscribers (e.g. a fan-out with none
+    /// registered yet) can return `false` so the buffer skips building
+    /// notifications for them. Defaults to `true`.
+    fn is_active(&self) -> bool {
+        true
+    }
 }
 
 /// In-memory transform graph with per-edge history.
@@ -217,6 +264,51 @@ pub struct BufferTree {
     index: NodeIndex,
     config: BufferConfig,
     observers: Vec<Box<dyn BufferObserver>>,
+    graph_version: u64,
+    path_cache: RwLock<PathCache>,
+}
+
+/// Upper bound on cached frame pairs; the cache is simply dropped when full.
+const PATH_CACHE_CAPACITY: usize = 4096;
+
+/// Resolved frame chains keyed by `(from, to)` node ids.
+///
+/// Only valid for the `graph_version` it was filled at; a lookup that sees a
+/// newer version clears it first. There is no per-entry eviction: once
+/// [`PATH_CACHE_CAPACITY`] pairs are cached, the whole map is cleared before
+/// the next insert. Lookups on a stable set of pairs never reach that.
+#[derive(Debug, Default)]
+struct PathCache {
+    graph_version: u64,
+    paths: FxHashMap<(usize, usize), Arc<[usize]>>,
+}
+
+/// A path between two frames, resolved once and reusable across lookups.
+///
+/// Created by [`BufferTree::resolve_path`] and consumed by
+/// [`BufferTree::lookup_latest_transform_resolved`], which skips the name
+/// hashing and path construction of
+/// [`lookup_latest_transform`](BufferTree::lookup_latest_transform). The path
+/// remembers the [`graph_version`](BufferTree::graph_version) it was resolved
+/// against and is re-resolved transparently when edges have been added since.
+#[derive(Debug, Clone)]
+pub struct ResolvedPath {
+    from: usize,
+    to: usize,
+    nodes: Arc<[usize]>,
+    graph_version: u64,
+}
+
+impl ResolvedPath {
+    /// Interned id of the source frame.
+    pub fn from_id(&self) -> usize {
+        self.from
+    }
+
+    /// Interned id of the target frame.
+    pub fn to_id(&self) -> usize {
+        self.to
+    }
 }
 
 impl BufferTree {
@@ -231,6 +323,8 @@ impl BufferTree {
             index: NodeIndex::new(),
             config: get_config().unwrap(),
             observers: Vec::new(),
+            graph_version: 0,
+            path_cache: RwLock::new(PathCache::default()),
         }
     }
 
@@ -239,26 +333,36 @@ impl BufferTree {
     /// in a single `on_update` call containing the full replay of the buffer
     /// state at registration time.
     pub fn register_observer(&mut self, observer: Box<dyn BufferObserver>) {
+        let replay = self.snapshot();
+        if !replay.is_empty() {
+            observer.on_update(&replay);
+        }
+        self.observers.push(observer);
+    }
+
+    /// Every sample currently held in the buffer, as a list of updates.
+    ///
+    /// This is the replay [`register_observer`](Self::register_observer)
+    /// hands to a new observer; it is exposed so bindings that multiplex
+    /// several observers behind one registration can replay to late joiners.
+    pub fn snapshot(&self) -> Vec<TransformUpdate> {
         let mut replay: Vec<TransformUpdate> = Vec::new();
         for (from_idx, to_idx, history) in self.graph.all_edges() {
             let from_node = self.index.get_node(from_idx);
             let to_node = self.index.get_node(to_idx);
 
             if let (Some(from_node), Some(to_node)) = (from_node, to_node) {
-                for item in &history.history {
+                for item in history.iter() {
                     replay.push(TransformUpdate {
                         from: from_node.name.clone(),
                         to: to_node.name.clone(),
-                        stamped_isometry: item.clone(),
+                        stamped_isometry: item,
                         kind: history.kind,
                     });
                 }
             }
         }
-        if !replay.is_empty() {
-            observer.on_update(&replay);
-        }
-        self.observers.push(observer);
+        replay
     }
 
     /// Recursively update the ancestors of a node and its children
@@ -324,6 +428,97 @@ impl BufferTree {
         Ok(())
     }
 
+    /// Resolve a frame name to its interned id, creating the frame if needed.
+    ///
+    /// Ids are stable for the lifetime of the buffer and can be passed to the
+    /// `*_by_id` methods to skip hashing the frame names on every call. Until
+    /// an edge touches the frame, lookups still report it as not existing.
+    pub fn intern_frame(&mut self, name: &str) -> usize {
+        self.index.index(name)
+    }
+
+    /// Id of an already-known frame, or `None` if the buffer has never seen it.
+    pub fn frame_id(&self, name: &str) -> Option<usize> {
+        self.index.get(name)
+    }
+
+    /// Name of the frame with the given id.
+    pub fn frame_name(&self, id: usize) -> Option<&str> {
+        self.index.get_node(id).map(|node| node.name.as_str())
+    }
+
+    fn check_frame_id(&self, id: usize, role: &str) -> Result<(), TfError> {
+        match self.index.get_node(id) {
+            Some(_) => Ok(()),
+            None => Err(TfError::CouldNotFindTransform(format!(
+                "{} frame id {} does not exist",
+                role, id
+            ))),
+        }
+    }
+
+    /// Like [`check_frame_id`](Self::check_frame_id), but also rejects frames
+    /// that were interned and never received an edge, so lookups on them
+    /// fail the same way as lookups on names the buffer has never seen.
+    fn check_lookup_frame_id(&self, id: usize, role: &str) -> Result<(), TfError> {
+        self.check_frame_id(id, role)?;
+        if !self.graph.contains_node(id) {
+            return Err(self.missing_frame_error(&self.index.get_node(id).unwrap().name, role));
+        }
+        Ok(())
+    }
+
+    /// Id of a frame to look up by name; see
+    /// [`check_lookup_frame_id`](Self::check_lookup_frame_id).
+    fn lookup_frame_id(&self, name: &str, role: &str) -> Result<usize, TfError> {
+        match self.index.get(name) {
+            Some(id) if self.graph.contains_node(id) => Ok(id),
+            _ => Err(self.missing_frame_error(name, role)),
+        }
+    }
+
+    fn missing_frame_error(&self, name: &str, role: &str) -> TfError {
+        TfError::CouldNotFindTransform(format!("{} frame '{}' does not exist", role, name))
+    }
+
+    /// Insert a single transform between two interned frames.
+    ///
+    /// Same semantics as [`update`](Self::update) with a one-element batch,
+    /// but takes ids from [`intern_frame`](Self::intern_frame) instead of
+    /// names. Frame names are only materialized when at least one observer
+    /// is [active](BufferObserver::is_active).
+    ///
+    /// # Errors
+    ///
+    /// - [`TfError::CouldNotFindTransform`] if either id was never interned.
+    /// - [`TfError::InvalidGraph`] under the same conditions as
+    ///   [`update`](Self::update).
+    pub fn update_by_id(
+        &mut self,
+        from: usize,
+        to: usize,
+        stamped_isometry: StampedIsometry,
+        kind: TransformType,
+    ) -> Result<(), TfError> {
+        self.check_frame_id(from, "Source")?;
+        self.check_frame_id(to, "Target")?;
+        self.insert_by_id(from, to, stamped_isometry.clone(), kind)?;
+
+        let mut active = self.observers.iter().filter(|o| o.is_active()).peekable();
+        if active.peek().is_some() {
+            let update = TransformUpdate {
+                from: self.index.get_node(from).unwrap().name.clone(),
+                to: self.index.get_node(to).unwrap().name.clone(),
+                stamped_isometry,
+                kind,
+            };
+            for observer in active {
+                observer.on_update(std::slice::from_ref(&update));
+            }
+        }
+        Ok(())
+    }
+
     fn insert_one(
         &mut self,
         from: &str,
@@ -333,7 +528,16 @@ impl BufferTree {
     ) -> Result<(), TfError> {
         let from_idx = self.index.index(from);
         let to_idx = self.index.index(to);
+        self.insert_by_id(from_idx, to_idx, stamped_isometry, kind)
+    }
 
+    fn insert_by_id(
+        &mut self,
+        from_idx: usize,
+        to_idx: usize,
+        stamped_isometry: StampedIsometry,
+        kind: TransformType,
+    ) -> Result<(), TfError> {
         if !self.graph.contains_node(from_idx) {
             self.graph.add_node(from_idx);
         }
@@ -399,6 +603,7 @@ impl BufferTree {
                 new_ancestor_ids.push(from_idx);
             }
             self.update_subtree_ancestors(to_idx, new_ancestors, new_ancestor_ids);
+            self.graph_version += 1;
         }
 
         self.graph
@@ -414,13 +619,60 @@ impl BufferTree {
     /// traverse the tree upwards from both nodes until we either hit the other node or the root
     /// Afterwards we prune the leftover path above the connection point
     #[allow(dead_code)]
-    fn find_path(&self, from: &str, to: &str) -> Option<Vec<usize>> {
+    fn find_path(&self, from: &str, to: &str) -> Option<Arc<[usize]>> {
         let from_idx = self.index.get(from)?;
         let to_idx = self.index.get(to)?;
         self.find_path_by_id(from_idx, to_idx)
     }
 
-    fn find_path_by_id(&self, from_idx: usize, to_idx: usize) -> Option<Vec<usize>> {
+    fn no_path_error(&self, from_idx: usize, to_idx: usize) -> TfError {
+        TfError::CouldNotFindTransform(format!(
+            "Could not find path between '{}' and '{}'",
+            self.frame_name(from_idx).unwrap_or_default(),
+            self.frame_name(to_idx).unwrap_or_default()
+        ))
+    }
+
+    /// [`find_path`](Self::find_path) by node id, memoized per frame pair.
+    ///
+    /// The tree only changes shape when an edge is added, which bumps
+    /// `graph_version`, so repeated lookups of the same pair reuse the chain
+    /// resolved on the first one. Unconnected pairs are not cached.
+    ///
+    /// Hits only take the read lock, so concurrent lookups (e.g. server
+    /// request handlers sharing a read guard on the buffer) do not serialize
+    /// on the cache. A miss resolves the chain without holding the lock and
+    /// then takes the write lock just to store it.
+    fn find_path_by_id(&self, from_idx: usize, to_idx: usize) -> Option<Arc<[usize]>> {
+        {
+            let cache = self
+                .path_cache
+                .read()
+                .unwrap_or_else(PoisonError::into_inner);
+            if cache.graph_version == self.graph_version {
+                if let Some(path) = cache.paths.get(&(from_idx, to_idx)) {
+                    return Some(Arc::clone(path));
+                }
+            }
+        }
+
+        let path: Arc<[usize]> = self.compute_path_by_id(from_idx, to_idx)?.into();
+        let mut cache = self
+            .path_cache
+            .write()
+            .unwrap_or_else(PoisonError::into_inner);
+        if cache.graph_version != self.graph_version {
+            cache.paths.clear();
+            cache.graph_version = self.graph_version;
+        }
+        if cache.paths.len() >= PATH_CACHE_CAPACITY {
+            cache.paths.clear();
+        }
+        cache.paths.insert((from_idx, to_idx), Arc::clone(&path));
+        Some(path)
+    }
+
+    fn compute_path_by_id(&self, from_idx: usize, to_idx: usize) -> Option<Vec<usize>> {
         let from_node = self.index.get_node(from_idx)?;
         let to_node = self.index.get_node(to_idx)?;
 
@@ -491,39 +743,98 @@ impl BufferTree {
         to: &str,
     ) -> Result<StampedIsometry, TfError> {
         // Get node IDs upfront to avoid redundant hash lookups
-        let from_idx = self.index.get(from).ok_or_else(|| {
-            TfError::CouldNotFindTransform(format!("Source frame '{}' does not exist", from))
-        })?;
-        let to_idx = self.index.get(to).ok_or_else(|| {
-            TfError::CouldNotFindTransform(format!("Target frame '{}' does not exist", to))
-        })?;
+        let from_idx = self.lookup_frame_id(from, "Source")?;
+        let to_idx = self.lookup_frame_id(to, "Target")?;
+        self.lookup_latest_transform_by_id(from_idx, to_idx)
+    }
 
-        let path = self.find_path_by_id(from_idx, to_idx);
-        match path {
-            Some(path) => {
-                let mut max_stamp: i64 = 0;
-                let isometry = self.compute_transform_along_path(&path, |history| {
-                    let latest_transform = history
-                        .history
-                        .back()
-                        .ok_or(TfError::CouldNotFindTransform(format!("")))?;
-                    // Track the maximum timestamp across all edges
-                    if latest_transform.stamp > max_stamp {
-                        max_stamp = latest_transform.stamp;
-                    }
-                    Ok(latest_transform.isometry)
-                })?;
+    /// [`lookup_latest_transform`](Self::lookup_latest_transform) for frames
+    /// given by their [`intern_frame`](Self::intern_frame) ids.
+    ///
+    /// # Errors
+    ///
+    /// - [`TfError::CouldNotFindTransform`] if either id is unknown or no
+    ///   path connects the frames.
+    pub fn lookup_latest_transform_by_id(
+        &self,
+        from_idx: usize,
+        to_idx: usize,
+    ) -> Result<StampedIsometry, TfError> {
+        self.check_lookup_frame_id(from_idx, "Source")?;
+        self.check_lookup_frame_id(to_idx, "Target")?;
 
-                Ok(StampedIsometry {
-                    isometry,
-                    stamp: max_stamp,
-                })
-            }
-            None => Err(TfError::CouldNotFindTransform(format!(
-                "Could not find path between '{}' and '{}'",
-                from, to
-            ))),
+        match self.find_path_by_id(from_idx, to_idx) {
+            Some(path) => self.latest_along_path(&path),
+            None => Err(self.no_path_error(from_idx, to_idx)),
+        }
+    }
+
+    /// Counter bumped every time an edge is added to the graph.
+    ///
+    /// Paths between existing frames can only change when this changes, so
+    /// callers may cache anything derived from the graph structure keyed on it.
+    pub fn graph_version(&self) -> u64 {
+        self.graph_version
+    }
+
+    /// Resolve the path between two interned frames once, for repeated
+    /// [`lookup_latest_transform_resolved`](Self::lookup_latest_transform_resolved) calls.
+    ///
+    /// # Errors
+    ///
+    /// - [`TfError::CouldNotFindTransform`] if either id is unknown or no
+    ///   path connects the frames.
+    pub fn resolve_path(&self, from_idx: usize, to_idx: usize) -> Result<ResolvedPath, TfError> {
+        self.check_lookup_frame_id(from_idx, "Source")?;
+        self.check_lookup_frame_id(to_idx, "Target")?;
+        let nodes = self
+            .find_path_by_id(from_idx, to_idx)
+            .ok_or_else(|| self.no_path_error(from_idx, to_idx))?;
+        Ok(ResolvedPath {
+            from: from_idx,
+            to: to_idx,
+            nodes,
+            graph_version: self.graph_version,
+        })
+    }
+
+    /// [`lookup_latest_transform`](Self::lookup_latest_transform) along a
+    /// pre-resolved path.
+    ///
+    /// Walks the cached node chain directly. If edges were added since the
+    /// path was resolved, it is re-resolved in place first.
+    ///
+    /// # Errors
+    ///
+    /// Same as [`lookup_latest_transform`](Self::lookup_latest_transform).
+    pub fn lookup_latest_transform_resolved(
+        &self,
+        path: &mut ResolvedPath,
+    ) -> Result<StampedIsometry, TfError> {
+        if path.graph_version != self.graph_version {
+            *path = self.resolve_path(path.from, path.to)?;
         }
+        self.latest_along_path(&path.nodes)
+    }
+
+    /// Compose the latest sample of every edge along `path`.
+    fn latest_along_path(&self, path: &[usize]) -> Result<StampedIsometry, TfError> {
+        let mut max_stamp: i64 = 0;
+        let isometry = self.compute_transform_along_path(path, |history| {
+            let latest_transform = history
+                .latest()
+                .ok_or(TfError::CouldNotFindTransform(format!("")))?;
+            // Track the maximum timestamp across all edges
+            if latest_transform.stamp > max_stamp {
+                max_stamp = latest_transform.stamp;
+            }
+            Ok(latest_transform.isometry)
+        })?;
+
+        Ok(StampedIsometry {
+            isometry,
+            stamp: max_stamp,
+        })
     }
 
     /// Look up a transform between two frames at a specific timestamp.
@@ -581,12 +892,26 @@ impl BufferTree {
         time: i64,
     ) -> Result<StampedIsometry, TfError> {
         // Get node IDs upfront to avoid redundant hash lookups
-        let from_idx = self.index.get(from).ok_or_else(|| {
-            TfError::CouldNotFindTransform(format!("Source frame '{}' does not exist", from))
-        })?;
-        let to_idx = self.index.get(to).ok_or_else(|| {
-            TfError::CouldNotFindTransform(format!("Target frame '{}' does not exist", to))
-        })?;
+        let from_idx = self.lookup_frame_id(from, "Source")?;
+        let to_idx = self.lookup_frame_id(to, "Target")?;
+        self.lookup_transform_by_id(from_idx, to_idx, time)
+    }
+
+    /// [`lookup_transform`](Self::lookup_transform) for frames given by their
+    /// [`intern_frame`](Self::intern_frame) ids.
+    ///
+    /// # Errors
+    ///
+    /// Same as [`lookup_transform`](Self::lookup_transform); unknown ids
+    /// produce [`TfError::CouldNotFindTransform`].
+    pub fn lookup_transform_by_id(
+        &self,
+        from_idx: usize,
+        to_idx: usize,
+        time: i64,
+    ) -> Result<StampedIsometry, TfError> {
+        self.check_lookup_frame_id(from_idx, "Source")?;
+        self.check_lookup_frame_id(to_idx, "Target")?;
 
         let path = self.find_path_by_id(from_idx, to_idx);
 
@@ -601,13 +926,50 @@ impl BufferTree {
                     stamp: time,
                 })
             }
-            None => Err(TfError::CouldNotFindTransform(format!(
-                "Could not find path between '{}' and '{}'",
-                from, to
-            ))),
+            None => Err(self.no_path_error(from_idx, to_idx)),
         }
     }
 
+    /// Look up a transform between two frames at many timestamps at once.
+    ///
+    /// Equivalent to calling [`lookup_transform`](Self::lookup_transform) for
+    /// every entry of `times`, but the frame chain and its edges are resolved
+    /// a single time up front; each stamp then only costs one binary search
+    /// per edge. Results are returned in the order of `times`.
+    ///
+    /// # Errors
+    ///
+    /// Same as [`lookup_transform`](Self::lookup_transform). The first stamp
+    /// that cannot be served aborts the whole batch.
+    pub fn lookup_transform_batch(
+        &self,
+        from: &str,
+        to: &str,
+        times: &[i64],
+    ) -> Result<Vec<StampedIsometry>, TfError> {
+        let from_idx = self.lookup_frame_id(from, "Source")?;
+        let to_idx = self.lookup_frame_id(to, "Target")?;
+        let path = self.resolve_path(from_idx, to_idx)?;
+        let edges = self
+            .edges_along_path(&path.nodes)
+            .collect::<Result<Vec<_>, _>>()?;
+
+        times
+            .iter()
+            .map(|&time| {
+                let mut isometry = Isometry3::identity();
+                for &(history, inverse) in &edges {
+                    let step = history.interpolate_isometry_at_time(time)?;
+                    isometry *= if inverse { step.inverse() } else { step };
+                }
+                Ok(StampedIsometry {
+                    isometry,
+                    stamp: time,
+                })
+            })
+            .collect()
+    }
+
     /// Render the current graph as a Graphviz DOT-format string.
     ///
     /// Each node is labeled with its frame name; each edge is labeled with
@@ -627,7 +989,7 @@ impl BufferTree {
 
         // Add edges with transform information
         for edge in self.graph.all_edges() {
-            if let Some(latest) = edge.2.history.back() {
+            if let Some(latest) = edge.2.latest() {
                 let translation = latest.isometry.translation.vector;
                 let rotation = latest.isometry.rotation.euler_angles();
                 dot.push_str(&format!(
@@ -681,6 +1043,28 @@ impl BufferTree {
         Ok(())
     }
 
+    /// The edge histories along `path`, each flagged `true` if it is
+    /// traversed against its stored direction.
+    fn edges_along_path<'a>(
+        &'a self,
+        path: &'a [usize],
+    ) -> impl Iterator<Item = Result<(&'a TransformHistory, bool), TfError>> + 'a {
+        path.windows(2).map(move |pair| {
+            let (from_idx, to_idx) = (pair[0], pair[1]);
+            // Try forward edge first, then reverse - avoids redundant contains_edge check
+            if let Some(edge_weight) = self.graph.edge_weight(from_idx, to_idx) {
+                Ok((edge_weight, false))
+            } else if let Some(edge_weight) = self.graph.edge_weight(to_idx, from_idx) {
+                Ok((edge_weight, true))
+            } else {
+                Err(TfError::CouldNotFindTransform(format!(
+                    "Edge transform not found for edge {} -> {}",
+                    from_idx, to_idx
+                )))
+            }
+        })
+    }
+
     /// Helper function to compute transforms along a path
     /// This function handles the common logic of iterating through a path and computing
     /// the cumulative transform. The transform_getter function determines how to get
@@ -695,22 +1079,10 @@ impl BufferTree {
     {
         let mut isometry = Isometry3::identity();
 
-        // Use direct indexing instead of windows(2) for better performance
-        for i in 0..path.len().saturating_sub(1) {
-            let from_idx = path[i];
-            let to_idx = path[i + 1];
-
-            // Try forward edge first, then reverse - avoids redundant contains_edge check
-            if let Some(edge_weight) = self.graph.edge_weight(from_idx, to_idx) {
-                isometry *= transform_getter(edge_weight)?;
-            } else if let Some(edge_weight) = self.graph.edge_weight(to_idx, from_idx) {
-                isometry *= transform_getter(edge_weight)?.inverse();
-            } else {
-                return Err(TfError::CouldNotFindTransform(format!(
-                    "Edge transform not found for edge {} -> {}",
-                    from_idx, to_idx
-                )));
-            }
+        for edge in self.edges_along_path(path) {
+            let (history, inverse) = edge?;
+            let step = transform_getter(history)?;
+            isometry *= if inverse { step.inverse() } else { step };
         }
 
         Ok(isometry)
@@ -1797,11 +2169,12 @@ mod tests {
         }
 
         // Check that oldest transforms (0.0s, 0.2s) were removed due to buffer window
-        assert!(history.history.len() < 6);
-        assert!(history.history.front().unwrap().stamp >= 200_000_000); // >= 0.2s
+        assert!(history.len() < 6);
+        assert_eq!(history.stamps.len(), history.isometries.len());
+        assert!(*history.stamps.front().unwrap() >= 200_000_000); // >= 0.2s
 
         // Check that newest transforms are still present (1.2s)
-        assert_eq!(history.history.back().unwrap().stamp, 1_200_000_000);
+        assert_eq!(history.latest().unwrap().stamp, 1_200_000_000);
 
         // Verify interpolation still works within the valid time range (1.0s = 1_000_000_000 ns)
         let result = history.interpolate_isometry_at_time(1_000_000_000);
@@ -1882,12 +2255,17 @@ mod tests {
     #[derive(Default)]
     struct CountingObserver {
         calls: Mutex<Vec<usize>>,
+        inactive: bool,
     }
 
     impl BufferObserver for std::sync::Arc<CountingObserver> {
         fn on_update(&self, updates: &[TransformUpdate]) {
             self.calls.lock().unwrap().push(updates.len());
         }
+
+        fn is_active(&self) -> bool {
+            !self.inactive
+        }
     }
 
     #[test]
@@ -1957,4 +2335,270 @@ mod tests {
         assert_eq!(calls.len(), 1, "observer should be invoked exactly once");
         assert_eq!(calls[0], 5, "observer should see the full 5-element batch");
     }
+
+    #[test]
+    fn test_lookup_transform_batch_matches_single_lookups() {
+        let mut buffer_tree = BufferTree::new();
+        for i in 0..=10 {
+            let secs = i as f64;
+            let (sin, cos) = (0.05 * secs).sin_cos();
+            let base = StampedIsometry::from_secs([secs, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], secs);
+            let arm = StampedIsometry::from_secs([0.0, 1.0, 0.0], [0.0, 0.0, sin, cos], secs);
+            buffer_tree
+                .update(&[
+                    TransformUpdate::new("world", "base", base, TransformType::Dynamic),
+                    TransformUpdate::new("base", "arm", arm, TransformType::Dynamic),
+                ])
+                .unwrap();
+        }
+
+        let times: Vec<i64> = (0..10_000).map(|i| i * 1_000_000).collect();
+        let batch = buffer_tree
+            .lookup_transform_batch("arm", "world", &times)
+            .unwrap();
+        assert_eq!(batch.len(), times.len());
+        for (&time, result) in times.iter().zip(&batch).step_by(997) {
+            let single = buffer_tree.lookup_transform("arm", "world", time).unwrap();
+            assert_eq!(result.stamp, time);
+            assert_eq!(result.isometry, single.isometry);
+        }
+
+        // One stamp outside the window fails the whole batch.
+        let result = buffer_tree.lookup_transform_batch("arm", "world", &[0, 11_000_000_000]);
+        assert!(matches!(result, Err(TfError::AttemptedLookUpInFuture(_))));
+    }
+
+    #[test]
+    fn test_static_history_keeps_only_latest_sample() {
+        let mut history = TransformHistory::new(TransformType::Static, 1.0);
+        for i in 0..5 {
+            history.update(StampedIsometry::new(
+                [i as f64, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0],
+                i * 1_000_000_000,
+            ));
+        }
+        assert_eq!(history.len(), 1);
+
+        // Any time resolves to the latest sample, even far outside the window.
+        for time in [0, 4_000_000_000, 100_000_000_000] {
+            let iso = history.interpolate_isometry_at_time(time).unwrap();
+            assert_eq!(iso.translation.vector[0], 4.0);
+        }
+    }
+
+    #[test]
+    fn test_snapshot_replays_every_sample() {
+        let mut buffer_tree = BufferTree::new();
+        assert!(buffer_tree.snapshot().is_empty());
+
+        for i in 0..3 {
+            let iso =
+                StampedIsometry::from_secs([i as f64, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], i as f64);
+            buffer_tree
+                .update(&[TransformUpdate::new("A", "B", iso, TransformType::Dynamic)])
+                .unwrap();
+        }
+
+        let snapshot = buffer_tree.snapshot();
+        assert_eq!(snapshot.len(), 3);
+        assert!(snapshot.iter().all(|u| u.from == "A" && u.to == "B"));
+    }
+
+    #[test]
+    fn test_update_and_lookup_by_id() {
+        let mut buffer_tree = BufferTree::new();
+        let sun = buffer_tree.intern_frame("Sun");
+        let earth = buffer_tree.intern_frame("Earth");
+        assert_eq!(buffer_tree.intern_frame("Sun"), sun);
+        assert_eq!(buffer_tree.frame_id("Earth"), Some(earth));
+        assert_eq!(buffer_tree.frame_name(earth), Some("Earth"));
+
+        let observer = std::sync::Arc::new(CountingObserver::default());
+        buffer_tree.register_observer(Box::new(observer.clone()));
+
+        for i in 0..2 {
+            let iso = StampedIsometry::new([i as f64, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], i);
+            buffer_tree
+                .update_by_id(sun, earth, iso, TransformType::Dynamic)
+                .unwrap();
+        }
+        assert_eq!(*observer.calls.lock().unwrap(), vec![1, 1]);
+
+        let latest = buffer_tree
+            .lookup_latest_transform_by_id(sun, earth)
+            .unwrap();
+        assert_eq!(latest.translation()[0], 1.0);
+        let by_name = buffer_tree.lookup_transform("Sun", "Earth", 1).unwrap();
+        let by_id = buffer_tree.lookup_transform_by_id(sun, earth, 1).unwrap();
+        assert_eq!(by_name.translation(), by_id.translation());
+
+        assert!(matches!(
+            buffer_tree.update_by_id(
+                sun,
+                99,
+                StampedIsometry::new([0.0; 3], [0.0, 0.0, 0.0, 1.0], 0),
+                TransformType::Static
+            ),
+            Err(TfError::CouldNotFindTransform(_))
+        ));
+        assert!(buffer_tree.lookup_latest_transform_by_id(99, sun).is_err());
+    }
+
+    #[test]
+    fn test_update_by_id_skips_inactive_observers() {
+        let mut buffer_tree = BufferTree::new();
+        let sun = buffer_tree.intern_frame("Sun");
+        let earth = buffer_tree.intern_frame("Earth");
+        let observer = std::sync::Arc::new(CountingObserver {
+            inactive: true,
+            ..Default::default()
+        });
+        buffer_tree.register_observer(Box::new(observer.clone()));
+
+        buffer_tree
+            .update_by_id(
+                sun,
+                earth,
+                StampedIsometry::new([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0),
+                TransformType::Static,
+            )
+            .unwrap();
+        assert!(observer.calls.lock().unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_lookup_on_interned_frame_without_edges() {
+        let mut buffer_tree = BufferTree::new();
+        let sun = buffer_tree.intern_frame("Sun");
+        let moon = buffer_tree.intern_frame("Moon");
+
+        for err in [
+            buffer_tree
+                .lookup_latest_transform("Moon", "Sun")
+                .unwrap_err(),
+            buffer_tree.lookup_transform("Moon", "Sun", 0).unwrap_err(),
+            buffer_tree
+                .lookup_latest_transform_by_id(moon, sun)
+                .unwrap_err(),
+        ] {
+            match err {
+                TfError::CouldNotFindTransform(msg) => {
+                    assert_eq!(msg, "Source frame 'Moon' does not exist")
+                }
+                other => panic!("unexpected error: {:?}", other),
+            }
+        }
+    }
+
+    #[test]
+    fn test_resolved_path_lookup_tracks_graph_changes() {
+        let mut buffer_tree = BufferTree::new();
+        let iso =
+            |x: f64, stamp: i64| StampedIsometry::new([x, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], stamp);
+        buffer_tree
+            .update(&[
+                TransformUpdate::new("Sun", "Earth", iso(2.0, 1), TransformType::Dynamic),
+                TransformUpdate::new("Earth", "Moon", iso(0.5, 1), TransformType::Dynamic),
+            ])
+            .unwrap();
+        let version = buffer_tree.graph_version();
+
+        let moon = buffer_tree.frame_id("Moon").unwrap();
+        let sun = buffer_tree.frame_id("Sun").unwrap();
+        let mut path = buffer_tree.resolve_path(moon, sun).unwrap();
+        let first = buffer_tree
+            .lookup_latest_transform_resolved(&mut path)
+            .unwrap();
+        assert_eq!(first.translation()[0], -2.5);
+
+        // New samples on existing edges do not change the graph version.
+        buffer_tree
+            .update(&[TransformUpdate::new(
+                "Sun",
+                "Earth",
+                iso(3.0, 2),
+                TransformType::Dynamic,
+            )])
+            .unwrap();
+        assert_eq!(buffer_tree.graph_version(), version);
+        let second = buffer_tree
+            .lookup_latest_transform_resolved(&mut path)
+            .unwrap();
+        assert_eq!(second.translation()[0], -3.5);
+        assert_eq!(second.stamp(), 2);
+
+        // A new edge bumps it; the cached path is re-resolved transparently.
+        buffer_tree
+            .update(&[TransformUpdate::new(
+                "Galaxy",
+                "Sun",
+                iso(1.0, 2),
+                TransformType::Static,
+            )])
+            .unwrap();
+        assert!(buffer_tree.graph_version() > version);
+        let third = buffer_tree
+            .lookup_latest_transform_resolved(&mut path)
+            .unwrap();
+        assert_eq!(
+            third.translation(),
+            buffer_tree
+                .lookup_latest_transform("Moon", "Sun")
+                .unwrap()
+                .translation()
+        );
+
+        assert!(buffer_tree.resolve_path(moon, 99).is_err());
+    }
+
+    #[test]
+    fn test_path_cache_repeated_lookups() {
+        let mut buffer_tree = BufferTree::new();
+        let iso =
+            |x: f64, stamp: i64| StampedIsometry::new([x, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], stamp);
+        buffer_tree
+            .update(&[
+                TransformUpdate::new("Sun", "Earth", iso(2.0, 1), TransformType::Dynamic),
+                TransformUpdate::new("Earth", "Moon", iso(0.5, 1), TransformType::Dynamic),
+            ])
+            .unwrap();
+
+        let first = buffer_tree.lookup_latest_transform("Moon", "Sun").unwrap();
+        for _ in 0..1000 {
+            let again = buffer_tree.lookup_latest_transform("Moon", "Sun").unwrap();
+            assert_eq!(again.isometry, first.isometry);
+            assert_eq!(again.stamp, first.stamp);
+        }
+        assert_eq!(buffer_tree.path_cache.read().unwrap().paths.len(), 1);
+
+        // Unconnected pairs are not cached; once an edge joins the two trees
+        // the stale cache is dropped and the new path is found.
+        buffer_tree
+            .update(&[TransformUpdate::new(
+                "Mars",
+                "Phobos",
+                iso(0.1, 1),
+                TransformType::Static,
+            )])
+            .unwrap();
+        assert!(buffer_tree
+            .lookup_latest_transform("Moon", "Phobos")
+            .is_err());
+        buffer_tree
+            .update(&[TransformUpdate::new(
+                "Sun",
+                "Mars",
+                iso(3.0, 1),
+                TransformType::Static,
+            )])
+            .unwrap();
+        let moon_to_phobos = buffer_tree
+            .lookup_latest_transform("Moon", "Phobos")
+            .unwrap();
+        assert_relative_eq!(moon_to_phobos.translation()[0], 0.6, epsilon = 1e-12);
+        let cache = buffer_tree.path_cache.read().unwrap();
+        assert_eq!(cache.graph_version, buffer_tree.graph_version());
+        assert_eq!(cache.paths.len(), 1);
+    }
 }
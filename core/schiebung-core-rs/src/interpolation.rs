@@ -0,0 +1,213 @@
+use nalgebra::{Isometry3, Translation3, UnitQuaternion};
+#[cfg(feature = "fast_slerp")]
+use std::f64::consts::FRAC_1_SQRT_2;
+
+/// Above this dot the two rotations are less than ~0.005° apart and a
+/// normalized lerp is within 1e-12 rad of the true arc, tighter than the
+/// polynomial it skips.
+#[cfg(feature = "fast_slerp")]
+const NLERP_DOT_THRESHOLD: f64 = 1.0 - 1e-9;
+
+// Eberly, "A Fast and Accurate Algorithm for Computing SLERP" (2011).
+// sin(t*theta)/sin(theta) is expanded as a polynomial in t and (cos(theta) - 1):
+//   c(t) = t * (1 + b_1 * (1 + b_2 * (... (1 + b_8))))
+//   b_i  = (u_i * t^2 - v_i) * (cos(theta) - 1)
+// with u_i = 1 / (i * (2i + 1)), v_i = i / (2i + 1) and the last term scaled
+// by mu to absorb the truncation error.
+#[cfg(feature = "fast_slerp")]
+const EBERLY_MU: f64 = 1.85298109240830;
+#[cfg(feature = "fast_slerp")]
+const EBERLY_U: [f64; 8] = [
+    1.0 / (1.0 * 3.0),
+    1.0 / (2.0 * 5.0),
+    1.0 / (3.0 * 7.0),
+    1.0 / (4.0 * 9.0),
+    1.0 / (5.0 * 11.0),
+    1.0 / (6.0 * 13.0),
+    1.0 / (7.0 * 15.0),
+    EBERLY_MU / (8.0 * 17.0),
+];
+#[cfg(feature = "fast_slerp")]
+const EBERLY_V: [f64; 8] = [
+    1.0 / 3.0,
+    2.0 / 5.0,
+    3.0 / 7.0,
+    4.0 / 9.0,
+    5.0 / 11.0,
+    6.0 / 13.0,
+    7.0 / 15.0,
+    EBERLY_MU * 8.0 / 17.0,
+];
+
+/// Evaluate Eberly's polynomial for `sin(t * theta) / sin(theta)` given `cos(theta) - 1`.
+#[cfg(feature = "fast_slerp")]
+#[inline]
+fn eberly_coefficient(t: f64, cos_minus_one: f64) -> f64 {
+    let t2 = t * t;
+    let mut acc = 1.0;
+    for i in (0..EBERLY_U.len()).rev() {
+        acc = 1.0 + (EBERLY_U[i] * t2 - EBERLY_V[i]) * cos_minus_one * acc;
+    }
+    t * acc
+}
+
+/// Exact SLERP weights for the two endpoints, given their (positive) dot product.
+#[inline]
+fn exact_weights(dot: f64, t: f64) -> (f64, f64) {
+    // Identical rotations up to rounding: sin(theta) would be ~0.
+    if dot >= 1.0 - f64::EPSILON {
+        return (1.0 - t, t);
+    }
+    let theta = dot.acos();
+    let sin_theta = (1.0 - dot * dot).sqrt();
+    let (st, ct) = (t * theta).sin_cos();
+    let cb = st / sin_theta;
+    (ct - dot * cb, cb)
+}
+
+/// SLERP weights for the two endpoints, given their (positive) dot product.
+#[cfg(feature = "fast_slerp")]
+#[inline]
+fn slerp_weights(dot: f64, t: f64) -> (f64, f64) {
+    if dot > NLERP_DOT_THRESHOLD {
+        (1.0 - t, t)
+    } else if dot >= FRAC_1_SQRT_2 {
+        let x = dot - 1.0;
+        (eberly_coefficient(1.0 - t, x), eberly_coefficient(t, x))
+    } else {
+        exact_weights(dot, t)
+    }
+}
+
+/// SLERP weights for the two endpoints, given their (positive) dot product.
+#[cfg(not(feature = "fast_slerp"))]
+#[inline]
+fn slerp_weights(dot: f64, t: f64) -> (f64, f64) {
+    exact_weights(dot, t)
+}
+
+/// Spherical linear interpolation between two unit quaternions.
+///
+/// Always follows the shortest arc. With the default `fast_slerp` feature,
+/// angles up to 90° between the two rotations (the common case for
+/// consecutive samples of a dynamic edge) use Eberly's trig-free polynomial,
+/// accurate to ~1e-8, rotations less than ~0.005° apart use a normalized
+/// lerp, and larger angles fall back to the exact `acos`/`sin` formulation.
+/// Without the feature every angle uses the exact formulation; only
+/// rotations equal up to rounding are lerped.
+pub fn slerp(q0: &UnitQuaternion<f64>, q1: &UnitQuaternion<f64>, t: f64) -> UnitQuaternion<f64> {
+    let a = *q0.quaternion();
+    let b = *q1.quaternion();
+    // Take the shorter arc of the double cover without a data-dependent
+    // branch: fold the sign of the dot product into q1 and the dot itself.
+    let raw_dot = a.dot(&b);
+    let sign = 1.0_f64.copysign(raw_dot);
+    let b = b * sign;
+    let dot = (raw_dot * sign).min(1.0);
+
+    let (ca, cb) = slerp_weights(dot, t);
+
+    UnitQuaternion::new_normalize(a * ca + b * cb)
+}
+
+/// Interpolate between two isometries: linear in translation, [`slerp`] in rotation.
+///
+/// Drop-in replacement for nalgebra's `Isometry3::lerp_slerp`, used when
+/// looking up dynamic transforms between two stored samples.
+pub fn lerp_slerp(a: &Isometry3<f64>, b: &Isometry3<f64>, t: f64) -> Isometry3<f64> {
+    let translation = a.translation.vector * (1.0 - t) + b.translation.vector * t;
+    Isometry3::from_parts(
+        Translation3::from(translation),
+        slerp(&a.rotation, &b.rotation, t),
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use approx::assert_relative_eq;
+    use nalgebra::Vector3;
+
+    #[test]
+    fn test_slerp_matches_nalgebra() {
+        let axis = Vector3::new(0.3, -0.5, 0.8).normalize();
+        let q0 = UnitQuaternion::from_euler_angles(0.1, -0.2, 0.3);
+        // Cover both the polynomial and the exact branch.
+        for deg in [0.0_f64, 1e-6, 5.0, 45.0, 89.0, 91.0, 135.0, 179.0] {
+            let q1 = q0 * UnitQuaternion::from_scaled_axis(axis * deg.to_radians());
+            for i in 0..=10 {
+                let t = i as f64 / 10.0;
+                let ours = slerp(&q0, &q1, t);
+                let reference = q0.slerp(&q1, t);
+                assert!(
+                    ours.angle_to(&reference) < 1e-7,
+                    "deg={deg} t={t}: {ours:?} vs {reference:?}"
+                );
+            }
+        }
+    }
+
+    #[cfg(feature = "fast_slerp")]
+    #[test]
+    fn test_slerp_near_parallel_uses_accurate_nlerp() {
+        let q0 = UnitQuaternion::from_euler_angles(0.1, -0.2, 0.3);
+        let axis = Vector3::new(0.0, 0.0, 1.0);
+        // Just inside the nlerp region, where the error is largest.
+        let q1 = q0 * UnitQuaternion::from_scaled_axis(axis * 0.004_f64.to_radians());
+        assert!(q0.quaternion().dot(q1.quaternion()) > NLERP_DOT_THRESHOLD);
+        for i in 0..=10 {
+            let t = i as f64 / 10.0;
+            let ours = slerp(&q0, &q1, t);
+            let reference = q0.slerp(&q1, t);
+            assert!((ours.coords - reference.coords).norm() < 1e-12, "t={t}");
+        }
+    }
+
+    #[cfg(not(feature = "fast_slerp"))]
+    #[test]
+    fn test_exact_slerp_matches_nalgebra_on_small_angles() {
+        let q0 = UnitQuaternion::from_euler_angles(0.1, -0.2, 0.3);
+        let axis = Vector3::new(0.3, -0.5, 0.8).normalize();
+        let q1 = q0 * UnitQuaternion::from_scaled_axis(axis * 1.0_f64.to_radians());
+        for i in 0..=10 {
+            let t = i as f64 / 10.0;
+            let ours = slerp(&q0, &q1, t);
+            let reference = q0.slerp(&q1, t);
+            assert!((ours.coords - reference.coords).norm() < 1e-12, "t={t}");
+        }
+    }
+
+    #[test]
+    fn test_slerp_identical_rotations() {
+        let q = UnitQuaternion::from_euler_angles(0.1, -0.2, 0.3);
+        for t in [0.0, 0.5, 1.0] {
+            let ours = slerp(&q, &q, t);
+            assert!((ours.coords - q.coords).norm() < 1e-12, "t={t}");
+        }
+    }
+
+    #[test]
+    fn test_slerp_takes_shortest_path() {
+        let q0 = UnitQuaternion::from_euler_angles(0.0, 0.0, 0.2);
+        let q1 = UnitQuaternion::from_euler_angles(0.0, 0.0, 0.4);
+        let flipped = UnitQuaternion::new_unchecked(-*q1.quaternion());
+        let expected = UnitQuaternion::from_euler_angles(0.0, 0.0, 0.3);
+        assert!(slerp(&q0, &flipped, 0.5).angle_to(&expected) < 1e-9);
+    }
+
+    #[test]
+    fn test_lerp_slerp_endpoints() {
+        let a = Isometry3::from_parts(
+            Translation3::new(0.0, 0.0, 0.0),
+            UnitQuaternion::from_euler_angles(0.0, 0.0, 0.0),
+        );
+        let b = Isometry3::from_parts(
+            Translation3::new(10.0, 0.0, 0.0),
+            UnitQuaternion::from_euler_angles(0.0, 0.0, 1.0),
+        );
+        let mid = lerp_slerp(&a, &b, 0.5);
+        assert_eq!(mid.translation.vector, Vector3::new(5.0, 0.0, 0.0));
+        assert_relative_eq!(mid.rotation.angle(), 0.5, epsilon = 1e-9);
+        assert!(lerp_slerp(&a, &b, 1.0).rotation.angle_to(&b.rotation) < 1e-9);
+    }
+}
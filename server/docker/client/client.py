@@ -3,7 +3,7 @@ import math
 import sys
 import logging
 import argparse
-from schiebung_server import TransformClient, StampedIsometry, TransformType
+from schiebung_server import TransformClient, TransformType
 
 # Configure logging for Docker visibility
 logging.basicConfig(
@@ -20,6 +20,7 @@ def main():
     parser.add_argument("--radius", type=float, required=True, help="Orbit radius")
     parser.add_argument("--period", type=float, required=True, help="Orbit period (seconds)")
     parser.add_argument("--z-offset", type=float, default=0.0, help="Z offset")
+    parser.add_argument("--rate", type=float, default=100.0, help="Publish rate (Hz)")
     args = parser.parse_args()
 
     logger.info(f"Starting client: {args.parent} -> {args.child}, radius={args.radius}, period={args.period}")
@@ -30,8 +31,11 @@ def main():
         logger.error(f"Failed to create client: {e}")
         sys.exit(1)
 
-    # Simulation loop
+    # Simulation loop, paced against absolute deadlines so send time and
+    # scheduler jitter don't accumulate into drift.
+    tick = 1.0 / args.rate
     start_time = time.time()
+    next_tick = time.monotonic()
 
     try:
         while True:
@@ -40,26 +44,29 @@ def main():
             current_time_ns = int(current_time * 1e9)
 
             angle = (current_time / args.period) * 2.0 * math.pi
-            x = args.radius * math.cos(angle)
-            y = args.radius * math.sin(angle)
-
-            transform = StampedIsometry(
-                [x, y, args.z_offset],
-                [0.0, 0.0, 0.0, 1.0],  # No rotation for simplicity
-                current_time_ns
-            )
 
             try:
-                client.send_transform(
+                # The rotation stays identity for simplicity, so send only
+                # the translation.
+                client.send_translation(
                     args.parent,
                     args.child,
-                    transform,
+                    args.radius * math.cos(angle),
+                    args.radius * math.sin(angle),
+                    args.z_offset,
+                    current_time_ns,
                     TransformType.Dynamic
                 )
             except Exception as e:
                 logger.error(f"Error sending transform: {e}")
 
-            time.sleep(0.01)  # Update at 100Hz
+            next_tick += tick
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; resync instead of bursting to catch up.
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         logger.info("Client stopped.")
@@ -1,5 +1,4 @@
 import rerun as rr
-import time
 import os
 import sys
 import logging
@@ -48,47 +47,52 @@ def main():
 
     # Log static geometry (Sun, Earth, Moon visual representation)
     # Note: Server does not publish these, it only visualizes transforms.
-    # We use standard Rerun logging here.
-    rr.set_time(args.timeline, timestamp=0)
-
-
+    # We use standard Rerun logging here; the geometry never changes, so it
+    # is logged as static data and needs no timeline.
     rr.log(
         "Sun",
         rr.Ellipsoids3D(half_sizes=[[0.15, 0.15, 0.15]], colors=[[255, 200, 0]]),
         rr.CoordinateFrame("Sun"),
+        static=True,
     )
 
     rr.log(
         "Earth",
         rr.Ellipsoids3D(half_sizes=[[0.08, 0.08, 0.08]], colors=[[50, 100, 200]]),
         rr.CoordinateFrame("Earth"),
+        static=True,
     )
 
     rr.log(
         "Moon",
         rr.Ellipsoids3D(half_sizes=[[0.04, 0.04, 0.04]], colors=[[180, 180, 180]]),
         rr.CoordinateFrame("Moon"),
+        static=True,
     )
 
     logger.info("Static geometry logged. Starting Server...")
 
+    # Resolve the Moon -> Sun path once; the handle reuses it on every wakeup.
+    moon_to_sun = server.buffer.compile_lookup("Moon", "Sun")
+
     try:
         while True:
-            iso = server.buffer.lookup_latest_transform("Moon", "Sun")
-            t = iso.translation()  # translation() is a method, returns [x, y, z]
+            # Park until the client publishes a newer Moon/Sun transform
+            # instead of polling the buffer at a fixed rate.
+            iso = moon_to_sun.wait_for_update(1.0)
+            if iso is None:
+                continue
 
             rr.set_time(args.timeline, timestamp=iso.stamp_secs())
             rr.log(
                 "Moon_to_Sun",
                 rr.Arrows3D(
                     origins=[[0,0,0]],
-                    vectors=[[t[0], t[1], t[2]]],
+                    vectors=[iso.as_translation()],
                     colors=[[255, 0, 0]]
                 ),
                 rr.CoordinateFrame("Moon"),
                 )
-
-            time.sleep(0.01)
     except KeyboardInterrupt:
         server_handle.shutdown()
         server_handle.join()
@@ -5,12 +5,16 @@
 
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use schiebung::BufferTree as CoreBufferTree;
+use schiebung::{
+    BufferTree as CoreBufferTree, ResolvedPath, StampedIsometry as CoreStampedIsometry,
+    TfError as CoreTfError,
+};
 use schiebung_server::{
     CommsError, Server as CoreServer, ServerHandle as CoreServerHandle,
-    TransformClient as CoreTransformClient,
+    TransformClient as CoreTransformClient, UpdateNotifier,
 };
 use std::sync::{Arc, Mutex, RwLock};
+use std::time::Duration;
 use tokio::runtime::Runtime;
 
 // Re-export Python wrapper types from schiebung-py to avoid duplication
@@ -67,6 +71,7 @@ impl ServerHandle {
 #[pyclass]
 pub struct BufferTreeRef {
     inner: Arc<RwLock<CoreBufferTree>>,
+    notifier: Arc<UpdateNotifier>,
 }
 
 #[pymethods]
@@ -126,6 +131,58 @@ impl BufferTreeRef {
         Ok(StampedIsometry::from(result))
     }
 
+    /// Block until a newer transform between two frames arrives.
+    ///
+    /// Parks the calling thread (with the GIL released) until the server
+    /// stores a transform that makes the latest `from_frame -> to_frame`
+    /// lookup newer than it was when the call started. Use this instead of
+    /// polling `lookup_latest_transform` in a sleep loop.
+    ///
+    /// Args:
+    ///     from_frame: The source frame name
+    ///     to_frame: The target frame name
+    ///     timeout_secs: Maximum time to wait, in seconds
+    ///
+    /// Returns:
+    ///     The new latest transform, or None if the timeout elapsed first
+    pub fn wait_for_update(
+        &self,
+        py: Python<'_>,
+        from_frame: &str,
+        to_frame: &str,
+        timeout_secs: f64,
+    ) -> PyResult<Option<StampedIsometry>> {
+        let timeout = timeout_from_secs(timeout_secs)?;
+        let result = py.detach(|| {
+            self.notifier
+                .wait_for_transform(&self.inner, from_frame, to_frame, timeout)
+        });
+        Ok(result.map(StampedIsometry::from))
+    }
+
+    /// Prepare a reusable lookup between two frames.
+    ///
+    /// The returned handle resolves the frame path on first use and keeps it
+    /// until the graph structure changes, so repeated `latest()` /
+    /// `wait_for_update()` calls skip the name hashing and path search of
+    /// `lookup_latest_transform`. The frames do not need to exist yet.
+    ///
+    /// Args:
+    ///     from_frame: The source frame name
+    ///     to_frame: The target frame name
+    ///
+    /// Returns:
+    ///     LookupHandle: A handle bound to this buffer and frame pair.
+    pub fn compile_lookup(&self, from_frame: String, to_frame: String) -> LookupHandle {
+        LookupHandle {
+            buffer: self.inner.clone(),
+            notifier: self.notifier.clone(),
+            from_frame,
+            to_frame,
+            path: Mutex::new(None),
+        }
+    }
+
     /// Visualize the buffer tree as a DOT graph string.
     ///
     /// Returns:
@@ -154,6 +211,76 @@ impl BufferTreeRef {
     }
 }
 
+/// A pre-resolved lookup between two frames, created by `BufferTreeRef.compile_lookup`.
+#[pyclass]
+pub struct LookupHandle {
+    buffer: Arc<RwLock<CoreBufferTree>>,
+    notifier: Arc<UpdateNotifier>,
+    from_frame: String,
+    to_frame: String,
+    path: Mutex<Option<ResolvedPath>>,
+}
+
+impl LookupHandle {
+    /// Latest transform along the cached path, resolving it on first use.
+    fn lookup(&self, buffer: &CoreBufferTree) -> Result<CoreStampedIsometry, CoreTfError> {
+        let mut path = self.path.lock().unwrap_or_else(|p| p.into_inner());
+        if path.is_none() {
+            let (Some(from), Some(to)) = (
+                buffer.frame_id(&self.from_frame),
+                buffer.frame_id(&self.to_frame),
+            ) else {
+                return buffer.lookup_latest_transform(&self.from_frame, &self.to_frame);
+            };
+            *path = Some(buffer.resolve_path(from, to)?);
+        }
+        buffer.lookup_latest_transform_resolved(path.as_mut().unwrap())
+    }
+}
+
+#[pymethods]
+impl LookupHandle {
+    /// Look up the latest transform between the two frames.
+    ///
+    /// Same result as `BufferTreeRef.lookup_latest_transform`.
+    pub fn latest(&self) -> PyResult<StampedIsometry> {
+        let guard = self
+            .buffer
+            .read()
+            .map_err(|e| PyValueError::new_err(format!("Lock poisoned: {}", e)))?;
+
+        let result = self
+            .lookup(&guard)
+            .map_err(|e| PyValueError::new_err(format!("Transform lookup error: {}", e)))?;
+
+        Ok(StampedIsometry::from(result))
+    }
+
+    /// Block until a newer transform between the two frames arrives.
+    ///
+    /// Same semantics as `BufferTreeRef.wait_for_update`, using the cached path.
+    ///
+    /// Args:
+    ///     timeout_secs: Maximum time to wait, in seconds
+    ///
+    /// Returns:
+    ///     The new latest transform, or None if the timeout elapsed first
+    pub fn wait_for_update(
+        &self,
+        py: Python<'_>,
+        timeout_secs: f64,
+    ) -> PyResult<Option<StampedIsometry>> {
+        let timeout = timeout_from_secs(timeout_secs)?;
+        let result = py.detach(|| {
+            self.notifier.wait_for_newer(timeout, || {
+                let guard = self.buffer.read().unwrap_or_else(|p| p.into_inner());
+                self.lookup(&guard).ok()
+            })
+        });
+        Ok(result.map(StampedIsometry::from))
+    }
+}
+
 /// Python wrapper for Server
 ///
 /// This is a centralized transform server with integrated Rerun visualization.
@@ -211,6 +338,7 @@ impl Server {
     pub fn buffer(&self) -> BufferTreeRef {
         BufferTreeRef {
             inner: self.inner.buffer(),
+            notifier: self.inner.notifier(),
         }
     }
 
@@ -285,7 +413,7 @@ impl TransformClient {
         &self,
         from_frame: String,
         to_frame: String,
-        stamped_isometry: StampedIsometry,
+        stamped_isometry: PyRef<'_, StampedIsometry>,
         kind: TransformType,
     ) -> PyResult<()> {
         let core_isometry = stamped_isometry.inner.clone();
@@ -299,6 +427,37 @@ impl TransformClient {
             .map_err(comms_err_to_pyerr)
     }
 
+    /// Send a pure translation (identity rotation) to the server.
+    ///
+    /// Cheaper than `send_transform` for frames that never rotate: no
+    /// `StampedIsometry` or rotation buffer is built on the Python side.
+    ///
+    /// Args:
+    ///     from_frame: The source frame name
+    ///     to_frame: The target frame name
+    ///     x, y, z: The translation
+    ///     stamp_ns: The timestamp in nanoseconds since Unix epoch
+    ///     kind: The transform type (static or dynamic)
+    #[allow(clippy::too_many_arguments)]
+    pub fn send_translation(
+        &self,
+        from_frame: String,
+        to_frame: String,
+        x: f64,
+        y: f64,
+        z: f64,
+        stamp_ns: i64,
+        kind: TransformType,
+    ) -> PyResult<()> {
+        self.runtime
+            .block_on(async {
+                self.inner
+                    .send_translation(&from_frame, &to_frame, [x, y, z], stamp_ns, kind.into())
+                    .await
+            })
+            .map_err(comms_err_to_pyerr)
+    }
+
     /// Request a transform from the server.
     ///
     /// Args:
@@ -331,12 +490,23 @@ fn comms_err_to_pyerr(err: CommsError) -> PyErr {
     PyValueError::new_err(format!("CommsError: {}", err))
 }
 
+/// Validate a Python `timeout_secs` argument and convert it to a `Duration`.
+fn timeout_from_secs(timeout_secs: f64) -> PyResult<Duration> {
+    Duration::try_from_secs_f64(timeout_secs).map_err(|_| {
+        PyValueError::new_err(format!(
+            "timeout_secs must be a non-negative number, got {}",
+            timeout_secs
+        ))
+    })
+}
+
 /// Python bindings for schiebung-server (transform server with Rerun visualization)
 #[pymodule(name = "schiebung_server")]
 fn schiebung_server_module(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<Server>()?;
     m.add_class::<ServerHandle>()?;
     m.add_class::<BufferTreeRef>()?;
+    m.add_class::<LookupHandle>()?;
     m.add_class::<TransformClient>()?;
     m.add_class::<StampedIsometry>()?;
     m.add_class::<TransformType>()?;
@@ -136,6 +136,14 @@ impl Server {
         self.inner.buffer()
     }
 
+    /// Get the notifier that fires whenever a received transform is stored.
+    ///
+    /// Use [`UpdateNotifier::wait_for_transform`] to block until a transform
+    /// changes instead of polling the buffer.
+    pub fn notifier(&self) -> Arc<UpdateNotifier> {
+        self.inner.notifier()
+    }
+
     /// Start the transform server in a background task.
     ///
     /// Returns a `ServerHandle` that can be used to shut down the server
@@ -178,5 +186,6 @@ impl Server {
 
 // Re-export common types for convenience
 pub use comms::error::CommsError;
+pub use comms::server::UpdateNotifier;
 pub use comms::TransformClient;
 pub use schiebung::BufferTree;
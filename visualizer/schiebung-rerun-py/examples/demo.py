@@ -7,11 +7,16 @@ This example demonstrates:
 2. Animating orbital mechanics with dynamic transforms
 3. Querying transforms between frames to calculate distances
 
+The per-step orbit math is JIT-compiled with numba when it is installed
+(`pip install numba`); otherwise the same kernel runs as plain Python.
+
 Equivalent to the Rust example at:
   schiebung/visualizer/schiebung-rerun-rs/examples/demo.rs
 """
 
 import math
+
+import numpy as np
 import rerun as rr
 
 from schiebung_rerun import (
@@ -20,20 +25,48 @@ from schiebung_rerun import (
     TransformType,
 )
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, run the kernel uncompiled
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
-def main():
-    # Spawn a single Rerun viewer (via the rerun SDK) and let the buffer tree
-    # connect to it instead of spawning its own.
-    rec = rr.RecordingStream(application_id="sun_earth_moon", recording_id="demo_id")
-    rec.spawn()
 
+@njit("Tuple((f8[::1], f8[::1], f8))(i8, f8, f8, f8, f8)", cache=True)
+def _compute_step(i, earth_radius, earth_period, moon_radius, moon_period):
+    """Earth position (in Sun), Moon position (in Earth) and Moon-Sun distance at step `i`."""
+    time_secs = i * 0.01
+
+    earth_angle = (time_secs / earth_period) * 2.0 * math.pi
+    earth_xyz = np.empty(3)
+    earth_xyz[0] = earth_radius * math.cos(earth_angle)
+    earth_xyz[1] = earth_radius * math.sin(earth_angle)
+    earth_xyz[2] = 0.0
+
+    moon_angle = (time_secs / moon_period) * 2.0 * math.pi
+    moon_xyz = np.empty(3)
+    moon_xyz[0] = moon_radius * math.cos(moon_angle)
+    moon_xyz[1] = moon_radius * math.sin(moon_angle)
+    moon_xyz[2] = 0.0
+
+    # Both orbits are pure translations, so the Moon-Sun distance is the
+    # norm of the summed offsets.
+    dx = earth_xyz[0] + moon_xyz[0]
+    dy = earth_xyz[1] + moon_xyz[1]
+    distance = math.sqrt(dx * dx + dy * dy)
+    return earth_xyz, moon_xyz, distance
+
+
+def main():
+    # The buffer tree spawns the viewer; the geometry below goes through the
+    # tree's own recording stream so both land in the same recording.
     tree = RerunBufferTree(
         "sun_earth_moon",       # application_id
         "demo_id",              # recording_id
         "stable_time",          # timeline
         True,                   # publish_static_transforms
-        spawn=False,            # connect to the viewer spawned above
     )
+    rec = tree.recording_stream()
 
     # Log the Sun
     rec.log(
@@ -78,51 +111,49 @@ def main():
     earth_period = 10.0
     moon_period = 2.0
 
+    # Intern the frame names once so the loop below never re-hashes strings.
+    sun = tree.buffer.intern_frame("Sun")
+    earth = tree.buffer.intern_frame("Earth")
+    moon = tree.buffer.intern_frame("Moon")
+
+    # Moon->Sun arrows are collected here and sent to Rerun as one column
+    # after the loop instead of one log call per step.
+    times = np.arange(num_steps) * 0.01
+    vectors = np.empty((num_steps, 3))
+    labels = []
+
+    # Reused every step; the buffer copies the value on insert.
+    earth_transform = StampedIsometry.identity()
+    moon_transform = StampedIsometry.identity()
+
     for i in range(num_steps):
-        time_secs = i * 0.01
-        time_ns = int(time_secs * 1_000_000_000)
+        time_ns = int(times[i] * 1_000_000_000)
 
-        # Earth orbit around Sun
-        earth_angle = (time_secs / earth_period) * 2.0 * math.pi
-        earth_x = earth_orbit_radius * math.cos(earth_angle)
-        earth_y = earth_orbit_radius * math.sin(earth_angle)
-
-        earth_transform = StampedIsometry(
-            [earth_x, earth_y, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-            time_ns,
+        earth_xyz, moon_xyz, distance = _compute_step(
+            i, earth_orbit_radius, earth_period, moon_orbit_radius, moon_period
         )
-        tree.buffer.update("Sun", "Earth", earth_transform, TransformType.Dynamic)
+
+        # Earth orbit around Sun
+        earth_transform.set_translation(earth_xyz[0], earth_xyz[1], earth_xyz[2])
+        earth_transform.set_stamp_ns(time_ns)
+        tree.buffer.update_by_id(sun, earth, earth_transform, TransformType.Dynamic)
 
         # Moon orbit around Earth
-        moon_angle = (time_secs / moon_period) * 2.0 * math.pi
-        moon_x = moon_orbit_radius * math.cos(moon_angle)
-        moon_y = moon_orbit_radius * math.sin(moon_angle)
-
-        moon_transform = StampedIsometry(
-            [moon_x, moon_y, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-            time_ns,
-        )
-        tree.buffer.update("Earth", "Moon", moon_transform, TransformType.Dynamic)
-
-        # Query transform from Moon to Sun and calculate distance
-        transform = tree.buffer.lookup_latest_transform("Moon", "Sun")
-        if transform is not None:
-            translation = transform.translation()
-            distance = math.sqrt(
-                translation[0]**2 + translation[1]**2 + translation[2]**2
-            )
-
-            rec.set_time("stable_time", timestamp=time_secs)
-            rec.log(
-                "Moon/distance",
-                rr.Arrows3D(
-                    vectors=[translation],
-                    labels=[f"{distance:.2f}"],
-                ),
-                rr.CoordinateFrame("Moon"),
-            )
+        moon_transform.set_translation(moon_xyz[0], moon_xyz[1], moon_xyz[2])
+        moon_transform.set_stamp_ns(time_ns)
+        tree.buffer.update_by_id(earth, moon, moon_transform, TransformType.Dynamic)
+
+        # Query transform from Moon to Sun
+        transform = tree.buffer.lookup_latest_transform_by_id(moon, sun)
+        vectors[i] = transform.as_translation()
+        labels.append(f"{distance:.2f}")
+
+    rec.log("Moon/distance", rr.CoordinateFrame("Moon"), static=True)
+    rec.send_columns(
+        "Moon/distance",
+        indexes=[rr.TimeColumn("stable_time", timestamp=times)],
+        columns=rr.Arrows3D.columns(vectors=vectors, labels=labels),
+    )
 
     print(f"Animated {num_steps} orbital steps")
     print("Check the Rerun viewer to see the Sun-Earth-Moon system!")
@@ -12,16 +12,16 @@ Equivalent to the Rust example at:
 """
 
 import argparse
-import math
 import os
 from pathlib import Path
+
+import numpy as np
 import rerun as rr
 
 from schiebung_rerun import (
     RerunBufferTree,
-    StampedIsometry,
-    TransformType,
     UrdfLoader,
+    quaternion_from_euler,
 )
 
 
@@ -47,42 +47,34 @@ def parse_args():
     return parser.parse_args()
 
 
-def quaternion_from_euler(roll: float, pitch: float, yaw: float) -> list[float]:
+def joint_angle_table(num_steps: int, num_joints: int) -> np.ndarray:
     """
-    Convert euler angles (roll, pitch, yaw) to quaternion [x, y, z, w].
+    Joint angles for one full animation cycle, shape (num_steps, num_joints).
 
-    Uses the ZYX convention (yaw first, then pitch, then roll).
+    Each joint follows the same sinusoid with amplitude 0.5 rad, phase-shifted
+    by 0.5 rad per joint index.
     """
-    cy = math.cos(yaw * 0.5)
-    sy = math.sin(yaw * 0.5)
-    cp = math.cos(pitch * 0.5)
-    sp = math.sin(pitch * 0.5)
-    cr = math.cos(roll * 0.5)
-    sr = math.sin(roll * 0.5)
+    angles = np.linspace(0.0, 2.0 * np.pi, num_steps, endpoint=False)
+    phases = 0.5 * np.arange(num_joints)
+    return 0.5 * np.sin(angles[:, None] + phases[None, :])
 
-    w = cr * cp * cy + sr * sp * sy
-    x = sr * cp * cy - cr * sp * sy
-    y = cr * sp * cy + sr * cp * sy
-    z = cr * cp * sy - sr * sp * cy
 
-    return [x, y, z, w]
+# Hamilton product a * b in [x, y, z, w] layout, written as one gather over
+# fixed index/sign tables: out[i] = sum_k a[_QA[k]] * b[_QB[i, k]] * _QS[i, k].
+_QA = np.array([3, 0, 1, 2])
+_QB = np.array([[0, 3, 2, 1], [1, 2, 3, 0], [2, 1, 0, 3], [3, 0, 1, 2]])
+_QS = np.array(
+    [[1.0, 1.0, 1.0, -1.0], [1.0, -1.0, 1.0, 1.0], [1.0, 1.0, -1.0, 1.0], [1.0, -1.0, -1.0, -1.0]]
+)
 
 
-def quaternion_multiply(q1: list[float], q2: list[float]) -> list[float]:
+def quat_mul_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     """
-    Multiply two quaternions q1 * q2.
+    Multiply quaternions a * b elementwise over broadcastable (..., 4) arrays.
 
     Quaternions are in [x, y, z, w] format.
     """
-    x1, y1, z1, w1 = q1
-    x2, y2, z2, w2 = q2
-
-    return [
-        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
-        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
-        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
-        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
-    ]
+    return (a[..., None, _QA] * b[..., _QB] * _QS).sum(axis=-1)
 
 
 def main():
@@ -91,64 +83,69 @@ def main():
 
     print(f"Loading URDF from {urdf_path}")
 
-    # Spawn a single Rerun viewer (via the rerun SDK); the buffer tree connects to it.
-    rec = rr.RecordingStream(application_id="urdf_demo", recording_id="urdf_demo_session")
-    rec.spawn()
-    rec.log_file_from_path(str(urdf_path), static=True)
-
-    # Create a RerunBufferTree connected to that viewer.
+    # Create a RerunBufferTree, which spawns the viewer.
     # publish_static_transforms=False since Rerun's URDF loader handles those.
     tree = RerunBufferTree(
         "urdf_demo",           # application_id
         "urdf_demo_session",   # recording_id
         "stable_time",         # timeline
         False,                 # publish_static_transforms
-        spawn=False,           # connect to the viewer spawned above
     )
 
+    # Log the URDF geometry into the same recording via the tree's stream.
+    rec = tree.recording_stream()
+    rec.log_file_from_path(str(urdf_path), static=True)
+
     # Load URDF into the buffer
     loader = UrdfLoader()
     loader.load_into_buffer(str(urdf_path), tree.buffer)
 
     # Define all dynamic (revolute) joints from the URDF with their initial transforms
-    # Each entry: (parent_link, child_link, xyz, rpy)
+    # Each entry: (parent_link, child_link, xyz, rpy, axis)
+    # Rotation axis is simplified: Z (2) for pan joints, Y (1) for lift/elbow/wrist.
     dynamic_joints = [
-        ("base_link", "shoulder_link", [0.0, 0.0, 0.1273], [0.0, 0.0, 0.0]),
-        ("shoulder_link", "upper_arm_link", [0.0, 0.220941, 0.0], [0.0, 1.57079632679, 0.0]),
-        ("upper_arm_link", "forearm_link", [0.0, -0.1719, 0.612], [0.0, 0.0, 0.0]),
-        ("forearm_link", "wrist_1_link", [0.0, 0.0, 0.5723], [0.0, 1.57079632679, 0.0]),
-        ("wrist_1_link", "wrist_2_link", [0.0, 0.1149, 0.0], [0.0, 0.0, 0.0]),
-        ("wrist_2_link", "wrist_3_link", [0.0, 0.0, 0.1157], [0.0, 0.0, 0.0]),
+        ("base_link", "shoulder_link", [0.0, 0.0, 0.1273], [0.0, 0.0, 0.0], 2),
+        ("shoulder_link", "upper_arm_link", [0.0, 0.220941, 0.0], [0.0, 1.57079632679, 0.0], 1),
+        ("upper_arm_link", "forearm_link", [0.0, -0.1719, 0.612], [0.0, 0.0, 0.0], 1),
+        ("forearm_link", "wrist_1_link", [0.0, 0.0, 0.5723], [0.0, 1.57079632679, 0.0], 1),
+        ("wrist_1_link", "wrist_2_link", [0.0, 0.1149, 0.0], [0.0, 0.0, 0.0], 2),
+        ("wrist_2_link", "wrist_3_link", [0.0, 0.0, 0.1157], [0.0, 0.0, 0.0], 1),
     ]
+    num_joints = len(dynamic_joints)
 
     # Animation parameters
     num_steps = 360
     duration = 5.0  # seconds
 
-    for step in range(num_steps):
-        time_secs = step * (duration / num_steps)
-        time_ns = int(time_secs * 1_000_000_000)  # Convert to nanoseconds
-        angle = (time_secs / duration) * 2.0 * math.pi
-
-        for joint_idx, (parent, child, xyz, rpy) in enumerate(dynamic_joints):
-            # Apply a phase-shifted sinusoidal rotation to each joint
-            joint_angle = math.sin(angle + joint_idx * 0.5) * 0.5
-
-            # Determine rotation axis from URDF (simplified: use Z for pan joints, Y for lift/elbow)
-            if joint_idx == 0:  # shoulder_pan: Z axis
-                axis_rotation = (0.0, 0.0, joint_angle)
-            elif joint_idx == 4:  # wrist_2: Z axis
-                axis_rotation = (0.0, 0.0, joint_angle)
-            else:  # shoulder_lift, elbow, wrist_1, wrist_3: Y axis
-                axis_rotation = (0.0, joint_angle, 0.0)
-
-            # Combine base rotation from URDF with joint rotation
-            base_rotation = quaternion_from_euler(rpy[0], rpy[1], rpy[2])
-            joint_rotation = quaternion_from_euler(*axis_rotation)
-            combined = quaternion_multiply(base_rotation, joint_rotation)
-
-            transform = StampedIsometry(list(xyz), combined, time_ns)
-            tree.buffer.update(parent, child, transform, TransformType.Dynamic)
+    # Compute the whole animation as one (num_steps, num_joints, 4) batch.
+    time_secs = np.arange(num_steps) * (duration / num_steps)
+    time_ns = (time_secs * 1_000_000_000).astype(np.int64)  # Convert to nanoseconds
+    joint_angle = joint_angle_table(num_steps, num_joints)
+
+    # Base rotation from the URDF, computed once per joint: (num_joints, 4)
+    base_rot = quaternion_from_euler(np.array([joint[3] for joint in dynamic_joints]))
+
+    # Joint rotation about a single axis: scatter each joint angle into the
+    # roll/pitch/yaw slot of its axis and convert the whole
+    # (num_steps, num_joints, 3) grid in one call -> (num_steps, num_joints, 4)
+    axes = np.array([joint[4] for joint in dynamic_joints])
+    axis_rpy = np.zeros((num_steps, num_joints, 3))
+    axis_rpy[:, np.arange(num_joints), axes] = joint_angle
+    axis_rot = quaternion_from_euler(axis_rpy)
+
+    # Combine base rotation from URDF with joint rotation
+    combined = quat_mul_batch(base_rot[None, :, :], axis_rot)
+
+    # Flatten the (step, joint) grid into one row per update and insert the
+    # whole animation with a single call.
+    parents = [joint[0] for joint in dynamic_joints] * num_steps
+    children = [joint[1] for joint in dynamic_joints] * num_steps
+    transforms = np.empty((num_steps, num_joints, 7))
+    transforms[..., :3] = np.array([joint[2] for joint in dynamic_joints])
+    transforms[..., 3:] = combined
+    stamps = np.repeat(time_ns, num_joints)
+    kinds = np.zeros(num_steps * num_joints, dtype=np.uint8)  # TransformType.Dynamic
+    tree.buffer.update_many(parents, children, transforms.reshape(-1, 7), stamps, kinds)
 
     print(f"Animated {num_steps} steps over {duration} seconds")
     print("Check the Rerun viewer to see the visualization!")
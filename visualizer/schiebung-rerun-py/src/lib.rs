@@ -18,6 +18,10 @@
 //! [`FileSink`], [`Stdout`], and/or [`BinaryStream`] to fan out the recording
 //! to multiple destinations. When `sinks` is supplied it takes the place of
 //! `spawn` / `connect_addr`; combining them raises `ValueError`.
+//!
+//! `recording_stream()` on either class returns a `rerun.RecordingStream` for
+//! the same application / recording ids and viewer, so scripts can log their
+//! own geometry next to the transforms without duplicating that setup.
 
 use std::path::PathBuf;
 use std::sync::OnceLock;
@@ -26,7 +30,7 @@ use std::time::Duration;
 use pyo3::basic::CompareOp;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyDict};
 use rerun::external::re_uri::ProxyUri;
 use rerun::log::ChunkBatcherConfig;
 use rerun::sink::{
@@ -370,6 +374,12 @@ fn core_kind_from_py(obj: &Bound<'_, PyAny>) -> PyResult<CoreTransformType> {
 #[pyclass]
 pub struct RerunObserver {
     inner: CoreRerunObserver,
+    application_id: String,
+    recording_id: String,
+    /// gRPC endpoint the stream logs to; `None` when routed through `sinks`.
+    connect_url: Option<String>,
+    /// Python-side `rerun.RecordingStream` handed out by `recording_stream()`.
+    companion: OnceLock<Py<PyAny>>,
 }
 
 #[pymethods]
@@ -420,9 +430,15 @@ impl RerunObserver {
         let batcher_config = batcher_config
             .map(|c| batcher_config_from_py(&c))
             .transpose()?;
+        // A spawned viewer listens on the default endpoint, same as `spawn=False`.
+        let connect_url = match (&sinks, &connect_addr) {
+            (Some(_), _) => None,
+            (None, Some(addr)) => Some(addr.clone()),
+            (None, None) => Some(rerun::DEFAULT_CONNECT_URL.to_owned()),
+        };
         let rec = build_recording_stream(
-            application_id,
-            recording_id,
+            application_id.clone(),
+            recording_id.clone(),
             spawn,
             connect_addr,
             batcher_config,
@@ -430,9 +446,56 @@ impl RerunObserver {
         )?;
         Ok(RerunObserver {
             inner: CoreRerunObserver::new(rec, publish_static_transforms, timeline),
+            application_id,
+            recording_id,
+            connect_url,
+            companion: OnceLock::new(),
         })
     }
 
+    /// The Rerun application id this logger records under.
+    #[getter]
+    fn application_id(&self) -> String {
+        self.application_id.clone()
+    }
+
+    /// The Rerun recording id this logger records under.
+    #[getter]
+    fn recording_id(&self) -> String {
+        self.recording_id.clone()
+    }
+
+    /// A `rerun.RecordingStream` logging into the same recording and viewer.
+    ///
+    /// Use it for everything the buffer does not log itself (meshes,
+    /// markers, scalars) instead of building a second stream with
+    /// hand-copied ids. The stream is created on first call, connected to
+    /// the viewer this logger targets, and the same object is returned
+    /// afterwards.
+    ///
+    /// Raises:
+    ///     ValueError: If the logger was built with `sinks=[…]`; add the
+    ///         matching sinks to your own `rerun.RecordingStream` instead.
+    fn recording_stream(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        if let Some(rec) = self.companion.get() {
+            return Ok(rec.clone_ref(py));
+        }
+        let url = self.connect_url.as_ref().ok_or_else(|| {
+            PyValueError::new_err(
+                "recording_stream() needs a viewer connection; it is not available with `sinks=[…]`",
+            )
+        })?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("application_id", &self.application_id)?;
+        kwargs.set_item("recording_id", &self.recording_id)?;
+        let rec = py
+            .import("rerun")?
+            .getattr("RecordingStream")?
+            .call((), Some(&kwargs))?;
+        rec.call_method1("connect_grpc", (url,))?;
+        Ok(self.companion.get_or_init(|| rec.unbind()).clone_ref(py))
+    }
+
     /// Buffer batch-observer hook — see `BufferTree.register_observer`.
     ///
     /// `updates` is a list of `(from, to, StampedIsometry, TransformType)` tuples.
@@ -478,6 +541,7 @@ impl RerunObserver {
 #[pyclass]
 pub struct RerunBufferTree {
     buffer: Py<PyAny>,
+    observer: Py<RerunObserver>,
 }
 
 #[pymethods]
@@ -514,9 +578,10 @@ impl RerunBufferTree {
             )?,
         )?;
         let buffer = py.import("schiebung")?.getattr("BufferTree")?.call0()?;
-        buffer.call_method1("register_observer", (observer,))?;
+        buffer.call_method1("register_observer", (observer.clone_ref(py),))?;
         Ok(RerunBufferTree {
             buffer: buffer.unbind(),
+            observer,
         })
     }
 
@@ -525,6 +590,25 @@ impl RerunBufferTree {
     pub fn buffer(&self, py: Python<'_>) -> Py<PyAny> {
         self.buffer.clone_ref(py)
     }
+
+    /// The Rerun application id the buffer is logged under.
+    #[getter]
+    fn application_id(&self, py: Python<'_>) -> String {
+        self.observer.borrow(py).application_id.clone()
+    }
+
+    /// The Rerun recording id the buffer is logged under.
+    #[getter]
+    fn recording_id(&self, py: Python<'_>) -> String {
+        self.observer.borrow(py).recording_id.clone()
+    }
+
+    /// A `rerun.RecordingStream` logging into the same recording and viewer.
+    ///
+    /// See `RerunObserver.recording_stream`.
+    fn recording_stream(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        self.observer.borrow(py).recording_stream(py)
+    }
 }
 
 /// Python bindings for schiebung with Rerun visualization.
@@ -547,6 +631,9 @@ fn schiebung_rerun_module(py: Python<'_>, m: &Bound<PyModule>) -> PyResult<()> {
         "TransformType",
         "TfError",
         "UrdfLoader",
+        "quaternion_from_euler",
+        "interpolate_raw",
+        "INTERPOLATE_RAW_ADDR",
     ] {
         m.add(name, schiebung.getattr(name)?)?;
     }
@@ -1,4 +1,5 @@
 """Tests for schiebung_rerun Python bindings."""
+import numpy as np
 import pytest
 import rerun as rr
 
@@ -53,6 +54,27 @@ def test_rerun_buffer_tree_creation():
     assert tree.buffer is not None
 
 
+def test_rerun_buffer_tree_recording_stream():
+    """recording_stream() targets the tree's recording and is created once."""
+    tree = RerunBufferTree("schiebung", "test_session", "stable_time", True, connect_addr=DEAD_ADDR)
+    assert tree.application_id == "schiebung"
+    assert tree.recording_id == "test_session"
+
+    rec = tree.recording_stream()
+    assert isinstance(rec, rr.RecordingStream)
+    assert tree.recording_stream() is rec
+
+
+def test_recording_stream_rejected_with_sinks(tmp_path):
+    """With sinks=[...] there is no single viewer to connect a stream to."""
+    tree = RerunBufferTree(
+        "schiebung", "test_session", "stable_time", True,
+        sinks=[FileSink(str(tmp_path / "out.rrd"))],
+    )
+    with pytest.raises(ValueError):
+        tree.recording_stream()
+
+
 def test_rerun_buffer_tree_update_and_lookup():
     """Test basic update and lookup with RerunBufferTree."""
     tree = RerunBufferTree("schiebung", "test_session", "stable_time", True, connect_addr=DEAD_ADDR)
@@ -68,11 +90,13 @@ def test_rerun_buffer_tree_dynamic_interpolation():
     """Test dynamic transform interpolation."""
     tree = RerunBufferTree("schiebung", "test_session", "stable_time", True, connect_addr=DEAD_ADDR)
 
-    t1 = StampedIsometry([0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 0)
-    t2 = StampedIsometry([10.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0], 10_000_000_000)
-
-    tree.buffer.update("odom", "base_link", t1, TransformType.Dynamic)
-    tree.buffer.update("odom", "base_link", t2, TransformType.Dynamic)
+    samples = StampedIsometry.from_arrays(
+        np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0]]),
+        np.array([[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, 0.0, 1.0]]),
+        np.array([0, 10_000_000_000], dtype=np.int64),
+    )
+    for sample in samples:
+        tree.buffer.update("odom", "base_link", sample, TransformType.Dynamic)
 
     # Lookup at t=5s (5_000_000_000 ns) should give [5.0, 0.0, 0.0]
     result = tree.buffer.lookup_transform("odom", "base_link", 5_000_000_000)